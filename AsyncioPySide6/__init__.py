@@ -19,7 +19,11 @@ Example:
     ...     AsyncioPySide6.runTask(my_coroutine())
 """
 
-from typing import Any, Dict
+import functools
+import importlib.util
+import warnings
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from .nvd.AsyncioPySide6 import AsyncioPySide6, use_asyncio
 from .nvd.config import AsyncioPySide6Config, get_config, reset_config, set_config
@@ -28,7 +32,7 @@ from .nvd.exceptions import (
     ConfigurationError,
     EventLoopError,
     InitializationError,
-    MemoryError,
+    MemoryLimitExceededError,
     ResourceExhaustedError,
     ShutdownError,
     TaskExecutionError,
@@ -36,8 +40,10 @@ from .nvd.exceptions import (
     ThreadSafetyError,
 )
 from .nvd.performance import (
+    HealthStatus,
     get_health_status,
     get_performance_monitor,
+    record_task,
     record_task_completion,
     record_task_start,
     start_performance_monitoring,
@@ -49,7 +55,7 @@ __version__ = "2.0.0"
 __author__ = "AsyncioPySide6 Team"
 __description__ = "Enhanced QtAsyncio integration with advanced async features"
 
-__all__ = [
+__all__ = (
     # Core library
     "AsyncioPySide6",
     "use_asyncio",
@@ -67,19 +73,33 @@ __all__ = [
     "ResourceExhaustedError",
     "ConfigurationError",
     "TaskExecutionError",
-    "MemoryError",
+    "MemoryLimitExceededError",
     # Performance monitoring
+    "HealthStatus",
     "get_performance_monitor",
     "start_performance_monitoring",
     "stop_performance_monitoring",
     "record_task_start",
     "record_task_completion",
+    "record_task",
     "get_health_status",
     # Version information
     "__version__",
     "__author__",
     "__description__",
-]
+)
+
+
+def __getattr__(name: str) -> Any:
+    # MemoryError shadowed the builtin; keep the old name importable for now
+    if name == "MemoryError":
+        warnings.warn(
+            "MemoryError is deprecated, use MemoryLimitExceededError instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return MemoryLimitExceededError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_version() -> str:
@@ -91,93 +111,109 @@ def get_version() -> str:
     return __version__
 
 
-def get_async_backends() -> Dict[str, Any]:
+# Static descriptions, built once; the accessors below return read-only views
+_ASYNC_BACKENDS = MappingProxyType(
+    {
+        # Our enhanced implementation
+        "asyncio_pyside6": MappingProxyType(
+            {
+                "available": True,
+                "name": "AsyncioPySide6",
+                "description": "Enhanced QtAsyncio integration with advanced features",
+                "features": (
+                    "qtasyncio_integration",
+                    "advanced_task_management",
+                    "timeout_handling",
+                    "retry_logic",
+                    "progress_tracking",
+                    "performance_monitoring",
+                    "health_checks",
+                    "thread_safety",
+                    "gui_thread_safety",
+                    "comprehensive_error_handling",
+                    "configuration_system",
+                    "backward_compatibility",
+                ),
+            }
+        ),
+    }
+)
+
+_RECOMMENDATIONS = MappingProxyType(
+    {
+        "simple_usage": MappingProxyType(
+            {"recommendation": "asyncio_pyside6", "reason": "Simple async tasks with QtAsyncio integration"}
+        ),
+        "production_usage": MappingProxyType(
+            {
+                "recommendation": "asyncio_pyside6",
+                "reason": "Production applications need comprehensive error handling and monitoring",
+            }
+        ),
+        "advanced_features": MappingProxyType(
+            {"recommendation": "asyncio_pyside6", "reason": "Advanced features like timeout, retry, and progress tracking"}
+        ),
+        "gui_applications": MappingProxyType(
+            {"recommendation": "asyncio_pyside6", "reason": "Seamless integration with Qt GUI applications"}
+        ),
+    }
+)
+
+
+def get_async_backends() -> Mapping[str, Any]:
     """
     Get information about available async backends.
 
     Returns:
-        dict: Dictionary with information about available backends and their capabilities
+        Mapping: Read-only mapping with information about available backends and their capabilities;
+        nested entries are read-only too, so use ``dict(...)`` for a mutable copy
     """
-    backends = {}
-
-    # Our enhanced implementation
-    backends["asyncio_pyside6"] = {
-        "available": True,
-        "name": "AsyncioPySide6",
-        "description": "Enhanced QtAsyncio integration with advanced features",
-        "features": [
-            "qtasyncio_integration",
-            "advanced_task_management",
-            "timeout_handling",
-            "retry_logic",
-            "progress_tracking",
-            "performance_monitoring",
-            "health_checks",
-            "thread_safety",
-            "gui_thread_safety",
-            "comprehensive_error_handling",
-            "configuration_system",
-            "backward_compatibility",
-        ],
-    }
-
-    return backends
+    return _ASYNC_BACKENDS
 
 
-def recommend_async_approach() -> Dict[str, Any]:
+def recommend_async_approach() -> Mapping[str, Any]:
     """
     Recommend the best async approach based on available backends and requirements.
 
     Returns:
-        dict: Dictionary with recommendations for different use cases
+        Mapping: Read-only mapping with recommendations for different use cases
     """
-    backends = get_async_backends()
-
-    recommendations = {
-        "simple_usage": {"recommendation": "asyncio_pyside6", "reason": "Simple async tasks with QtAsyncio integration"},
-        "production_usage": {
-            "recommendation": "asyncio_pyside6",
-            "reason": "Production applications need comprehensive error handling and monitoring",
-        },
-        "advanced_features": {
-            "recommendation": "asyncio_pyside6",
-            "reason": "Advanced features like timeout, retry, and progress tracking",
-        },
-        "gui_applications": {"recommendation": "asyncio_pyside6", "reason": "Seamless integration with Qt GUI applications"},
-    }
-
-    return recommendations
+    return _RECOMMENDATIONS
 
 
+@functools.cache
 def is_qtasyncio_available() -> bool:
     """
     Check if QtAsyncio is available in the current PySide6 installation.
 
+    The result is computed once. QtAsyncio is located with find_spec rather
+    than imported, so answering does not load it.
+
     Returns:
         bool: True if QtAsyncio is available, False otherwise
     """
     try:
-        import PySide6.QtAsyncio as QtAsyncio
-
-        return True
+        return importlib.util.find_spec("PySide6.QtAsyncio") is not None
     except ImportError:
+        # PySide6 itself is missing
         return False
 
 
-def get_qtasyncio_info() -> Dict[str, Any]:
+@functools.cache
+def get_qtasyncio_info() -> Mapping[str, Any]:
     """
     Get information about QtAsyncio availability and features.
 
     Returns:
-        dict: Dictionary with QtAsyncio information
+        Mapping: Read-only mapping with QtAsyncio information
     """
     qtasyncio_available = is_qtasyncio_available()
 
-    info = {
-        "available": qtasyncio_available,
-        "name": "PySide6 QtAsyncio",
-        "description": "Built-in async support for PySide6",
-        "features": ["basic_async", "qt_integration", "signal_handling", "debug_mode"] if qtasyncio_available else [],
-    }
-
-    return info
+    return MappingProxyType(
+        {
+            "available": qtasyncio_available,
+            "name": "PySide6 QtAsyncio",
+            "description": "Built-in async support for PySide6",
+            "features": ("basic_async", "qt_integration", "signal_handling", "debug_mode") if qtasyncio_available else (),
+        }
+    )
@@ -6,12 +6,17 @@ memory usage tracking, task execution metrics, and health checks.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
+import os
+import sys
 import threading
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, NotRequired, Optional, Tuple, TypedDict, Union
 
 import psutil
 
@@ -20,10 +25,60 @@ from .exceptions import ResourceExhaustedError
 
 logger = logging.getLogger(__name__)
 
+# AsyncioPySide6 issues int task ids; string ids remain accepted
+TaskId = Union[int, str]
 
-@dataclass
+# Upper bound on recycled TaskMetrics kept for reuse; extras are dropped
+_METRICS_POOL_SIZE = 1024
+
+# Task records kept before the oldest completed ones are evicted early;
+# records of tasks still running are never evicted
+_TASK_RECORD_LIMIT = 10_000
+
+# Number of event loop lag samples kept for the p95 estimate
+_LAG_SAMPLE_SIZE = 256
+
+# Linux exposes the resident set size, in pages, as the second field of this file
+_STATM_PATH = "/proc/self/statm"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if sys.platform.startswith("linux") else 0
+
+# Pending task events are applied once this many have queued up
+_EVENT_BATCH_SIZE = 256
+
+# Task event kinds in the monitor's event queue
+_TASK_START = 0
+_TASK_COMPLETE = 1
+
+
+class HealthStatus(TypedDict):
+    """Health status mapping returned by get_health_status
+
+    A plain dict at runtime; the TypedDict only documents and type-checks
+    the keys. The NotRequired keys are added by AsyncioPySide6.get_health_status.
+    """
+
+    status: str
+    message: str
+    metrics: Dict[str, Any]
+    uptime: float
+    memory_usage: float
+    performance_score: float
+    active_tasks: int
+    error_rate: float
+    completed_tasks: int
+    loop_lag_p95: float
+    qtasyncio_available: NotRequired[bool]
+    async_manager_initialized: NotRequired[bool]
+    performance_monitoring: NotRequired[bool]
+
+
+@dataclass(slots=True, frozen=True)
 class PerformanceMetrics:
-    """Performance metrics data class"""
+    """Performance metrics data class
+
+    Immutable once sampled, and slotted since the monitor keeps a history of
+    them.
+    """
 
     timestamp: float
     active_tasks: int
@@ -48,11 +103,15 @@ class PerformanceMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskMetrics:
-    """Task execution metrics"""
+    """Task execution metrics
+
+    start_time and end_time are time.monotonic() readings, so only their
+    differences are meaningful. Slotted, as one record is kept per task.
+    """
 
-    task_id: str
+    task_id: TaskId
     start_time: float
     end_time: Optional[float] = None
     execution_time: Optional[float] = None
@@ -60,67 +119,242 @@ class TaskMetrics:
     error: Optional[str] = None
     memory_usage: Optional[float] = None
 
+    def reset(self, task_id: TaskId, start_time: float) -> None:
+        """Reinitialize the metrics in place for reuse by a new task"""
+        self.task_id = task_id
+        self.start_time = start_time
+        self.end_time = None
+        self.execution_time = None
+        self.success = None
+        self.error = None
+        self.memory_usage = None
+
+
+class _State(IntEnum):
+    """Circuit breaker states, usable as indices into the dispatch table"""
+
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
 
 class CircuitBreaker:
-    """Circuit breaker pattern for fault tolerance"""
+    """Circuit breaker pattern for fault tolerance
+
+    call() is a closure built per instance with the threshold and recovery
+    time baked in as locals; assigning either attribute rebuilds it.
+    """
+
+    call: Callable[..., Any]
 
     def __init__(self, threshold: int = 5, timeout: float = 60.0, recovery_time: float = 300.0) -> None:
-        self.threshold = threshold
+        self._threshold = threshold
         self.timeout = timeout
-        self.recovery_time = recovery_time
+        self._recovery_time = recovery_time
         self.failure_count: int = 0
-        self.last_failure_time: float = 0.0
-        self.state: str = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        self.last_failure_time: float = 0.0  # time.time() of the last failure
+        self._last_failure_ns: int = 0  # time.monotonic_ns() of the last failure, used for recovery
+        self._state = _State.CLOSED
         self._lock = threading.Lock()
+        self._build_call()
+
+    @property
+    def state(self) -> str:
+        """Current state name: CLOSED, OPEN or HALF_OPEN"""
+        return self._state.name
+
+    @state.setter
+    def state(self, value: str) -> None:
+        self._state = _State[value]
+
+    @property
+    def threshold(self) -> int:
+        """Consecutive failures that open the circuit"""
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, value: int) -> None:
+        self._threshold = value
+        self._build_call()
+
+    @property
+    def recovery_time(self) -> float:
+        """Seconds the circuit stays open before a trial call is let through"""
+        return self._recovery_time
+
+    @recovery_time.setter
+    def recovery_time(self, value: float) -> None:
+        self._recovery_time = value
+        self._build_call()
+
+    def _build_call(self) -> None:
+        """Specialize call() for the current threshold and recovery time"""
+        threshold = self._threshold
+        recovery_ns = int(self._recovery_time * 1_000_000_000)
+        lock = self._lock
+        monotonic_ns = time.monotonic_ns
+
+        def record_failure() -> None:
+            self.failure_count += 1
+            self._last_failure_ns = monotonic_ns()
+            self.last_failure_time = time.time()
+            if self.failure_count >= threshold:
+                self._state = _State.OPEN
+
+        def call_closed(func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                record_failure()
+                raise
 
-    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
-        """Execute function with circuit breaker protection"""
-        with self._lock:
-            if self.state == "OPEN":
-                if time.time() - self.last_failure_time > self.recovery_time:
-                    self.state = "HALF_OPEN"
-                else:
-                    raise ResourceExhaustedError("Circuit breaker is OPEN")
-
+        def call_half_open(func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
             try:
                 result = func(*args, **kwargs)
-                if self.state == "HALF_OPEN":
-                    self.state = "CLOSED"
-                    self.failure_count = 0
-                return result
-            except Exception as e:
-                self.failure_count += 1
-                self.last_failure_time = time.time()
+            except Exception:
+                record_failure()
+                raise
+            self._state = _State.CLOSED
+            self.failure_count = 0
+            return result
+
+        def call_open(func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+            if monotonic_ns() - self._last_failure_ns <= recovery_ns:
+                raise ResourceExhaustedError("Circuit breaker is OPEN")
+            self._state = _State.HALF_OPEN
+            return call_half_open(func, args, kwargs)
+
+        # Indexed by _State, so call() dispatches without comparing states
+        dispatch = (call_closed, call_open, call_half_open)
 
-                if self.failure_count >= self.threshold:
-                    self.state = "OPEN"
+        def call(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+            """Execute function with circuit breaker protection"""
+            with lock:
+                return dispatch[self._state](func, args, kwargs)
 
-                raise e
+        self.call = call
 
 
 class PerformanceMonitor:
     """Performance monitoring and metrics collection"""
 
     def __init__(self) -> None:
-        self.config = get_config()
-        self.metrics_history: deque = deque(maxlen=1000)
-        self.task_metrics: Dict[str, TaskMetrics] = {}
-        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
         self._monitoring_task: Optional[asyncio.Task] = None
+        self._lag_task: Optional[asyncio.Task] = None
         self._stop_monitoring = threading.Event()
         self._lock = threading.Lock()
 
+        # Total RAM read once; it doesn't change at runtime
+        self._total_memory: int = psutil.virtual_memory().total
+        self._statm_fd: Optional[int] = None
+        self._bind_process()
+
+        # Test-expected attributes
+        self._monitoring = False
+        self.reset()
+
+    def reset(self) -> None:
+        """Stop monitoring and discard all collected state
+
+        The instance itself is kept so references to it stay valid; the
+        configuration is re-read.
+        """
+        self.stop_monitoring()
+        self.config = get_config()
+        # Fixed-capacity ring buffer: appends never reallocate and old samples fall off
+        self.metrics_history: deque = deque(maxlen=self.config.metrics_history_size)
+        self._task_records: Dict[TaskId, TaskMetrics] = {}
+        # Task start/completion events appended without locking by the record_*
+        # methods; flush() applies them to _task_records in order
+        self._events: deque = deque()
+        self._metrics_pool: deque = deque(maxlen=_METRICS_POOL_SIZE)
+        # Min-heap of (end_time, seq, task_id) for completed tasks, oldest
+        # first; seq breaks ties so int and str ids are never compared
+        self._expiry_heap: List[Tuple[float, int, TaskId]] = []
+        self._expiry_seq = itertools.count()
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        # Seconds by which each fixed-interval probe sleep overshot its deadline
+        self._lag_samples: deque = deque(maxlen=_LAG_SAMPLE_SIZE)
+        # Lag samples taken so far; unlike len(_lag_samples) it keeps growing once
+        # the deque is full, so it tells the health cache a new sample arrived
+        self._lag_sample_count = 0
+        # (monotonic time, cache key, result) of the last get_health_status call
+        self._health_cache: Optional[Tuple[float, Tuple[Any, int, int], HealthStatus]] = None
+
         # Performance counters
         self._task_count: float = 0.0
         self._error_count: float = 0.0
-        self._start_time = time.time()
-        self._last_metrics_time = time.time()
+        # Number of successful records currently held in task_metrics
+        self._completed_count: int = 0
+        self._start_time = time.monotonic()
+        self._last_metrics_time = self._start_time
 
-        # Test-expected attributes
-        self._monitoring = False
-        self._task_metrics = self.task_metrics  # Alias for backward compatibility
         self._metrics = self.metrics_history  # Alias for backward compatibility
 
+    def __del__(self) -> None:
+        fd = getattr(self, "_statm_fd", None)
+        if fd is not None:
+            os.close(fd)
+
+    def _bind_process(self) -> None:
+        """Bind the process handles to the current process
+
+        psutil.Process() binds the current pid and /proc/self is resolved when
+        the file is opened, so a forked child must rebind both.
+        """
+        self._pid = os.getpid()
+        self._process = psutil.Process()
+        # Prime the CPU baseline so the first collected sample isn't a wasted 0.0
+        self._process.cpu_percent(interval=None)
+        # On Linux a held /proc/self/statm descriptor makes each RSS read a single
+        # pread; elsewhere, or if it can't be opened, psutil is used instead
+        if self._statm_fd is not None:
+            os.close(self._statm_fd)
+            self._statm_fd = None
+        if _PAGE_SIZE:
+            try:
+                self._statm_fd = os.open(_STATM_PATH, os.O_RDONLY)
+            except OSError:
+                pass
+
+    def _rss(self) -> int:
+        """Resident set size of the process in bytes"""
+        if self._pid != os.getpid():
+            self._bind_process()
+        if self._statm_fd is not None:
+            try:
+                return int(os.pread(self._statm_fd, 128, 0).split()[1]) * _PAGE_SIZE
+            except (OSError, ValueError, IndexError):
+                pass
+        return self._process.memory_info().rss
+
+    @property
+    def task_metrics(self) -> Dict[TaskId, TaskMetrics]:
+        """Task metrics keyed by task id, with pending events applied
+
+        Assign a new dict, e.g. ``monitor.task_metrics = {}``, to replace the
+        records; that also rebuilds the expiry order and completed-task count,
+        which editing the returned dict in place does not.
+        """
+        self.flush()
+        return self._task_records
+
+    @task_metrics.setter
+    def task_metrics(self, value: Dict[TaskId, TaskMetrics]) -> None:
+        with self._lock:
+            self._apply_events()
+            self._task_records = value
+            self._expiry_heap = [
+                (metric.end_time, next(self._expiry_seq), task_id)
+                for task_id, metric in value.items()
+                if metric.end_time is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+            self._completed_count = sum(1 for metric in value.values() if metric.success is True)
+
+    # Alias for backward compatibility
+    _task_metrics = task_metrics
+
     def _has_event_loop(self) -> bool:
         """Check if there's an active event loop.
 
@@ -148,6 +382,7 @@ class PerformanceMonitor:
                 asyncio.get_running_loop()
                 # Only create the task if we have an event loop
                 self._monitoring_task = asyncio.create_task(self._monitor_loop())
+                self._lag_task = asyncio.create_task(self._lag_probe())
                 logger.info("Performance monitoring started")
             except RuntimeError:
                 logger.warning("No active event loop for performance monitoring, but marking as enabled")
@@ -163,6 +398,9 @@ class PerformanceMonitor:
             except Exception:
                 pass
             self._monitoring_task = None
+            if self._lag_task:
+                self._lag_task.cancel()
+                self._lag_task = None
             logger.info("Performance monitoring stopped")
 
     async def _monitor_loop(self) -> None:
@@ -170,7 +408,7 @@ class PerformanceMonitor:
         try:
             while not self._stop_monitoring.is_set():
                 try:
-                    metrics = self._collect_metrics()
+                    metrics = self._collect_metrics(await self._probe_latency())
                     self.metrics_history.append(metrics)
 
                     # Check for memory warnings
@@ -181,7 +419,7 @@ class PerformanceMonitor:
                         logger.warning(f"High memory usage: {metrics.memory_percentage:.1f}%")
 
                     # Check for performance issues
-                    if metrics.event_loop_latency_ms > 100:  # 100ms threshold
+                    if metrics.event_loop_latency_ms > self.config.loop_lag_threshold_ms:
                         logger.warning(f"High event loop latency: {metrics.event_loop_latency_ms:.2f}ms")
 
                     await asyncio.sleep(self.config.metrics_interval)
@@ -194,61 +432,159 @@ class PerformanceMonitor:
         except Exception as e:
             logger.error(f"Fatal error in monitoring loop: {e}")
 
-    def _collect_metrics(self) -> PerformanceMetrics:
-        """Collect current performance metrics"""
-        process = psutil.Process()
-        memory_info = process.memory_info()
+    async def _lag_probe(self) -> None:
+        """Sample event loop lag as the overshoot of a fixed-interval sleep"""
+        loop = asyncio.get_running_loop()
+        interval = self.config.loop_lag_interval
+        try:
+            while not self._stop_monitoring.is_set():
+                started = loop.time()
+                await asyncio.sleep(interval)
+                self._lag_samples.append(max(0.0, loop.time() - started - interval))
+                self._lag_sample_count += 1
+        except asyncio.CancelledError:
+            pass
+
+    async def _probe_latency(self) -> float:
+        """Seconds a callback queued with call_soon waits before the loop runs it"""
+        loop = asyncio.get_running_loop()
+        ran = loop.create_future()
+        started = loop.time()
+
+        def probe() -> None:
+            if not ran.done():
+                ran.set_result(loop.time() - started)
+
+        loop.call_soon(probe)
+        return await ran
+
+    def loop_lag_p95_ms(self) -> float:
+        """95th percentile of the sampled event loop lag in milliseconds"""
+        if not self._lag_samples:
+            return 0.0
+        ordered = sorted(self._lag_samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000
+
+    def _collect_metrics(self, event_loop_latency: Optional[float] = None) -> PerformanceMetrics:
+        """Collect current performance metrics
+
+        event_loop_latency is a call_soon round trip in seconds; without it the
+        latest lag probe sample is reported.
+        """
+        self.flush()
+        rss = self._rss()
 
         # Calculate memory usage
-        memory_usage_mb = memory_info.rss / 1024 / 1024
-        memory_percentage = memory_info.rss / psutil.virtual_memory().total
+        memory_usage_mb = rss / 1024 / 1024
+        memory_percentage = rss / self._total_memory
 
         # Calculate CPU usage
-        cpu_percentage = process.cpu_percent()
+        cpu_percentage = self._process.cpu_percent()
 
-        # Calculate task completion rate
-        current_time = time.time()
-        time_window = current_time - self._last_metrics_time
+        # Calculate task completion rate over a monotonic window
+        now = time.monotonic()
+        time_window = now - self._last_metrics_time
         task_completion_rate = self._task_count / max(time_window, 1.0)
         error_rate = self._error_count / max(time_window, 1.0)
 
         # Reset counters
         self._task_count = 0.0
         self._error_count = 0.0
-        self._last_metrics_time = current_time
+        self._last_metrics_time = now
 
-        # Calculate event loop latency (simplified)
-        event_loop_latency = 0.0  # This would need actual measurement
+        # Otherwise the latest event loop lag sample from the probe, if it is running
+        if event_loop_latency is None:
+            event_loop_latency = self._lag_samples[-1] if self._lag_samples else 0.0
 
         return PerformanceMetrics(
-            timestamp=current_time,
-            active_tasks=len(self.task_metrics),
+            timestamp=time.time(),
+            active_tasks=len(self._task_records),
             memory_usage_mb=memory_usage_mb,
             memory_percentage=memory_percentage,
-            event_loop_latency_ms=event_loop_latency,
+            event_loop_latency_ms=event_loop_latency * 1000,
             task_completion_rate=task_completion_rate,
             error_rate=error_rate,
             cpu_usage_percentage=cpu_percentage,
         )
 
-    def record_task_start(self, task_id: str) -> None:
+    def record_task_start(self, task_id: TaskId) -> None:
         """Record task start"""
-        with self._lock:
-            self.task_metrics[task_id] = TaskMetrics(task_id=task_id, start_time=time.time())
-            self._task_count += 1
+        # deque.append is atomic, so producers never wait on the monitor lock
+        self._events.append((_TASK_START, task_id, time.monotonic(), None, None))
+        if len(self._events) >= _EVENT_BATCH_SIZE:
+            self.flush()
 
-    def record_task_completion(self, task_id: str, success: bool, error: Optional[str] = None) -> None:
+    def record_task_completion(self, task_id: TaskId, success: bool, error: Optional[str] = None) -> None:
         """Record task completion"""
-        with self._lock:
-            if task_id in self.task_metrics:
-                task_metric = self.task_metrics[task_id]
-                task_metric.end_time = time.time()
-                task_metric.execution_time = task_metric.end_time - task_metric.start_time
-                task_metric.success = success
-                task_metric.error = error
+        self._events.append((_TASK_COMPLETE, task_id, time.monotonic(), success, error))
+        if len(self._events) >= _EVENT_BATCH_SIZE:
+            self.flush()
+
+    def record_task(
+        self, task_id: TaskId, start_time: float, end_time: float, success: bool, error: Optional[str] = None
+    ) -> None:
+        """Record a finished task's start and completion in one step
+
+        For tasks that need no in-flight visibility, e.g. ones that fail
+        before they are scheduled. Times are time.monotonic() readings.
+        """
+        self._events.extend(
+            ((_TASK_START, task_id, start_time, None, None), (_TASK_COMPLETE, task_id, end_time, success, error))
+        )
+        if len(self._events) >= _EVENT_BATCH_SIZE:
+            self.flush()
 
-                if not success:
-                    self._error_count += 1
+    def flush(self) -> None:
+        """Apply all pending task events to the task metrics"""
+        with self._lock:
+            self._apply_events()
+
+    def _apply_events(self) -> None:
+        """Drain the event queue; the caller must hold the lock"""
+        events = self._events
+        records = self._task_records
+        while events:
+            kind, task_id, timestamp, success, error = events.popleft()
+            if kind == _TASK_START:
+                if self._metrics_pool:
+                    task_metric = self._metrics_pool.pop()
+                    task_metric.reset(task_id, timestamp)
+                else:
+                    task_metric = TaskMetrics(task_id=task_id, start_time=timestamp)
+                previous = records.get(task_id)
+                if previous is not None and previous.success is True:
+                    self._completed_count -= 1
+                records[task_id] = task_metric
+                self._task_count += 1
+                while len(records) > _TASK_RECORD_LIMIT and self._expiry_heap:
+                    self._release_oldest()
+                continue
+
+            task_metric = records.get(task_id)
+            if task_metric is None:
+                continue
+            if success and task_metric.success is not True:
+                self._completed_count += 1
+            elif not success and task_metric.success is True:
+                self._completed_count -= 1
+            task_metric.end_time = timestamp
+            task_metric.execution_time = timestamp - task_metric.start_time
+            task_metric.success = success
+            task_metric.error = error
+            heapq.heappush(self._expiry_heap, (timestamp, next(self._expiry_seq), task_id))
+
+            if not success:
+                self._error_count += 1
+
+    def _release_oldest(self) -> None:
+        """Return the oldest completed record to the pool; the caller must hold the lock"""
+        end_time, _, task_id = heapq.heappop(self._expiry_heap)
+        metric = self._task_records.get(task_id)
+        # Skip stale entries for ids that were restarted since
+        if metric is not None and metric.end_time == end_time:
+            if metric.success is True:
+                self._completed_count -= 1
+            self._metrics_pool.append(self._task_records.pop(task_id))
 
     def get_circuit_breaker(self, name: str) -> CircuitBreaker:
         """Get or create a circuit breaker"""
@@ -260,8 +596,30 @@ class PerformanceMonitor:
             )
         return self.circuit_breakers[name]
 
-    def get_health_status(self) -> Dict[str, Any]:
-        """Get current health status"""
+    def get_health_status(self) -> HealthStatus:
+        """Get current health status
+
+        A result is reused for up to config.health_cache_ttl seconds as long
+        as no sample, task completion or lag sample has been recorded since.
+        """
+        self.flush()
+        now = time.monotonic()
+        history = self.metrics_history
+        key = (history[-1] if history else None, self._completed_count, self._lag_sample_count)
+        cached = self._health_cache
+        if cached is not None and cached[1] == key and now - cached[0] < self.config.health_cache_ttl:
+            health = cached[2]
+        else:
+            health = self._build_health_status()
+            self._health_cache = (now, key, health)
+        # Callers get their own copy, so mutating it can't alter the cached result
+        result = health.copy()
+        result["metrics"] = dict(health["metrics"])
+        result["uptime"] = now - self._start_time
+        return result
+
+    def _build_health_status(self) -> HealthStatus:
+        """Build the health status from the latest sample"""
         try:
             # Find the latest valid metrics
             latest_metrics = None
@@ -273,12 +631,9 @@ class PerformanceMonitor:
             if latest_metrics is None:
                 # Create a basic health status with fallback values
                 try:
-                    import psutil
-
-                    process = psutil.Process()
-                    memory_info = process.memory_info()
-                    memory_usage_mb = memory_info.rss / 1024 / 1024
-                    memory_percentage = (memory_info.rss / psutil.virtual_memory().total) * 100
+                    rss = self._rss()
+                    memory_usage_mb = rss / 1024 / 1024
+                    memory_percentage = (rss / self._total_memory) * 100
 
                     return {
                         "status": "healthy",
@@ -289,14 +644,15 @@ class PerformanceMonitor:
                             "active_tasks": 0,
                             "task_completion_rate": 1.0,
                             "error_rate": 0.0,
-                            "cpu_usage_percentage": process.cpu_percent(),
+                            "cpu_usage_percentage": self._process.cpu_percent(),
                         },
-                        "uptime": time.time() - self._start_time,
+                        "uptime": time.monotonic() - self._start_time,
                         "memory_usage": memory_usage_mb,
                         "performance_score": 100.0,
                         "active_tasks": 0,
                         "error_rate": 0.0,
                         "completed_tasks": 0,
+                        "loop_lag_p95": self.loop_lag_p95_ms(),
                     }
                 except Exception as e:
                     logger.warning(f"Could not create fallback health status: {e}")
@@ -304,16 +660,16 @@ class PerformanceMonitor:
                         "status": "unknown",
                         "message": "No metrics available and fallback failed",
                         "metrics": {},
-                        "uptime": time.time() - self._start_time,
+                        "uptime": time.monotonic() - self._start_time,
                         "memory_usage": 0,
                         "performance_score": 0,
                         "active_tasks": 0,
                         "error_rate": 0,
                         "completed_tasks": 0,
+                        "loop_lag_p95": 0.0,
                     }
 
-            # Calculate completed tasks
-            completed_tasks = sum(1 for task in self.task_metrics.values() if task.success is True)
+            loop_lag_p95 = self.loop_lag_p95_ms()
 
             # Determine health status with more reasonable thresholds
             if latest_metrics.memory_percentage > 90:  # Only critical at 90%+
@@ -325,6 +681,9 @@ class PerformanceMonitor:
             elif latest_metrics.error_rate > 0.1:
                 status = "warning"
                 message = "High error rate"
+            elif loop_lag_p95 > self.config.loop_lag_threshold_ms:
+                status = "degraded"
+                message = "Event loop lag high"
             else:
                 status = "healthy"
                 message = "All systems operational"
@@ -333,12 +692,13 @@ class PerformanceMonitor:
                 "status": status,
                 "message": message,
                 "metrics": latest_metrics.to_dict(),
-                "uptime": time.time() - self._start_time,
+                "uptime": time.monotonic() - self._start_time,
                 "memory_usage": latest_metrics.memory_usage_mb,
                 "performance_score": 100 - (latest_metrics.error_rate * 100),
                 "active_tasks": latest_metrics.active_tasks,
                 "error_rate": latest_metrics.error_rate,
-                "completed_tasks": completed_tasks,
+                "completed_tasks": self._completed_count,
+                "loop_lag_p95": loop_lag_p95,
             }
         except Exception as e:
             logger.error(f"Error getting health status: {e}")
@@ -346,12 +706,13 @@ class PerformanceMonitor:
                 "status": "error",
                 "message": f"Error getting health status: {e}",
                 "metrics": {},
-                "uptime": time.time() - self._start_time,
+                "uptime": time.monotonic() - self._start_time,
                 "memory_usage": 0,
                 "performance_score": 0,
                 "active_tasks": 0,
                 "error_rate": 0,
                 "completed_tasks": 0,
+                "loop_lag_p95": 0.0,
             }
 
     def get_recent_metrics(self, count: int = 10) -> List[PerformanceMetrics]:
@@ -360,32 +721,46 @@ class PerformanceMonitor:
 
     def cleanup_old_metrics(self) -> None:
         """Clean up old task metrics and old metrics history"""
-        current_time = time.time()
         with self._lock:
-            # Remove task metrics older than 1 hour
-            cutoff_time = current_time - 3600
-            self.task_metrics = {
-                task_id: metric
-                for task_id, metric in self.task_metrics.items()
-                if metric.end_time is None or metric.end_time > cutoff_time
-            }
-            # Remove old metrics from metrics_history
-            self.metrics_history = deque(
-                [m for m in self.metrics_history if getattr(m, "timestamp", 0) > cutoff_time], maxlen=1000
-            )
-            self._metrics = self.metrics_history  # keep alias in sync
+            self._apply_events()
+            # Remove task metrics older than 1 hour; task times are monotonic
+            cutoff_time = time.monotonic() - 3600
+            # Only the expired front of the heap is visited; expired records go
+            # back to the pool for reuse by later task starts.
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= cutoff_time:
+                self._release_oldest()
+            # Remove old metrics from metrics_history; sample timestamps are wall-clock
+            # and appended in order, so expired samples sit at the front of the deque.
+            # The deque is trimmed in place so aliases to it stay valid.
+            cutoff_time = time.time() - 3600
+            history = self.metrics_history
+            while history and getattr(history[0], "timestamp", 0) <= cutoff_time:
+                history.popleft()
+
+
+_MONITOR: Optional[PerformanceMonitor] = None
+_MONITOR_LOCK = threading.Lock()
 
 
-# Global performance monitor instance
-_performance_monitor: Optional[PerformanceMonitor] = None
+def get_performance_monitor() -> PerformanceMonitor:
+    """Get the global performance monitor instance
 
+    The instance is created on first use, so it picks up any configuration
+    set before then, and is never replaced; call its ``reset()`` method to
+    discard collected state.
+    """
+    # Monitor instances are always truthy, so the steady state is one global load
+    return _MONITOR or _create_monitor()
 
-def get_performance_monitor() -> PerformanceMonitor:
-    """Get the global performance monitor instance"""
-    global _performance_monitor
-    if _performance_monitor is None:
-        _performance_monitor = PerformanceMonitor()
-    return _performance_monitor
+
+def _create_monitor() -> PerformanceMonitor:
+    """Create the global performance monitor on first use"""
+    global _MONITOR
+    with _MONITOR_LOCK:
+        if _MONITOR is None:
+            _MONITOR = PerformanceMonitor()
+        return _MONITOR
 
 
 def start_performance_monitoring() -> None:
@@ -406,12 +781,9 @@ def start_performance_monitoring() -> None:
         if not monitor._has_event_loop():
             # Create an initial metric to ensure health status works
             try:
-                import psutil
-
-                process = psutil.Process()
-                memory_info = process.memory_info()
-                memory_usage_mb = memory_info.rss / 1024 / 1024
-                memory_percentage = (memory_info.rss / psutil.virtual_memory().total) * 100
+                rss = monitor._rss()
+                memory_usage_mb = rss / 1024 / 1024
+                memory_percentage = (rss / monitor._total_memory) * 100
 
                 initial_metric = PerformanceMetrics(
                     timestamp=time.time(),
@@ -421,7 +793,7 @@ def start_performance_monitoring() -> None:
                     event_loop_latency_ms=0.0,
                     task_completion_rate=0.0,
                     error_rate=0.0,
-                    cpu_usage_percentage=process.cpu_percent(),
+                    cpu_usage_percentage=monitor._process.cpu_percent(),
                 )
                 monitor.metrics_history.append(initial_metric)
             except Exception as e:
@@ -432,24 +804,34 @@ def start_performance_monitoring() -> None:
 
 def stop_performance_monitoring() -> None:
     """Stop performance monitoring"""
-    global _performance_monitor
-    if _performance_monitor:
-        _performance_monitor.stop_monitoring()
+    # Don't create a monitor just to stop it
+    if _MONITOR is not None:
+        _MONITOR.stop_monitoring()
+
+
+def record_task_start(task_id: TaskId) -> None:
+    """Record task start; a no-op while task monitoring is disabled"""
+    if not get_config().enable_task_monitoring:
+        return
+    get_performance_monitor().record_task_start(task_id)
 
 
-def record_task_start(task_id: str) -> None:
-    """Record task start"""
-    monitor = get_performance_monitor()
-    monitor.record_task_start(task_id)
+def record_task_completion(task_id: TaskId, success: bool, error: Optional[str] = None) -> None:
+    """Record task completion; a no-op while task monitoring is disabled"""
+    if not get_config().enable_task_monitoring:
+        return
+    get_performance_monitor().record_task_completion(task_id, success, error)
 
 
-def record_task_completion(task_id: str, success: bool, error: Optional[str] = None) -> None:
-    """Record task completion"""
-    monitor = get_performance_monitor()
-    monitor.record_task_completion(task_id, success, error)
+def record_task(
+    task_id: TaskId, start_time: float, end_time: float, success: bool, error: Optional[str] = None
+) -> None:
+    """Record a finished task in one step; a no-op while task monitoring is disabled"""
+    if not get_config().enable_task_monitoring:
+        return
+    get_performance_monitor().record_task(task_id, start_time, end_time, success, error)
 
 
-def get_health_status() -> Dict[str, Any]:
+def get_health_status() -> HealthStatus:
     """Get current health status"""
-    monitor = get_performance_monitor()
-    return monitor.get_health_status()
+    return get_performance_monitor().get_health_status()
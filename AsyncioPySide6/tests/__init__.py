@@ -5,14 +5,18 @@ This package contains comprehensive tests for the refactored AsyncioPySide6
 implementation that uses QtAsyncio as the base while adding advanced features.
 
 Test Modules:
+- conftest.py: Autouse fixture resetting config and the singleton around each test
 - test_core.py: Core functionality tests
 - test_performance.py: Performance monitoring tests
+- test_config.py: Configuration tests (no singleton state, safe to run in parallel)
 
 Usage:
     python -m pytest AsyncioPySide6/tests/
     python -m pytest AsyncioPySide6/tests/test_core.py
     python -m pytest AsyncioPySide6/tests/test_performance.py
+    python -m pytest AsyncioPySide6/tests/test_config.py
+    python -m pytest -n auto --dist loadgroup AsyncioPySide6/tests/  # needs pytest-xdist
 """
 
 # Test modules
-__all__ = ["test_core", "test_performance"]
+__all__ = ["test_core", "test_performance", "test_config"]
@@ -7,41 +7,82 @@ implementation that uses QtAsyncio as the base while adding advanced features.
 
 import asyncio
 import sys
-import time
-from typing import Any
-from unittest.mock import MagicMock, Mock, patch
+import threading
+from typing import Iterator, Optional
+from unittest.mock import Mock, patch
 
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # optional; the stock asyncio loop is used without it
+    uvloop = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, "..")
 
-from AsyncioPySide6 import AsyncioPySide6, get_config, reset_config, set_config
+from AsyncioPySide6 import AsyncioPySide6, get_config, set_config
+from AsyncioPySide6.nvd import exceptions
 from AsyncioPySide6.nvd.exceptions import (
     AsyncioPySide6Error,
     ConfigurationError,
     EventLoopError,
+    MemoryLimitExceededError,
     TaskExecutionError,
     TaskTimeoutError,
 )
 
 
-class TestAsyncioPySide6Core:
-    """Test core functionality of AsyncioPySide6."""
+@pytest.fixture(scope="module")
+def loop_runner() -> Iterator[asyncio.Runner]:
+    """One event loop shared by the module's async tests instead of one per asyncio.run."""
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        # Python 3.12+: coroutines that finish without suspending, like the
+        # immediately failing retry attempts, complete without a scheduled Task
+        if hasattr(asyncio, "eager_task_factory"):
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+        yield runner
+
+
+# Stand-ins for Qt objects the code under test only passes through
+_GUI_OBJ_SENTINEL = object()
+_APP_SENTINEL = object()
+
+
+@pytest.fixture
+def inline_qtimer() -> Iterator[None]:
+    """Deliver QTimer.singleShot callbacks immediately; there is no Qt event loop in tests."""
+    with patch("AsyncioPySide6.nvd.AsyncioPySide6.QTimer.singleShot", side_effect=lambda _msec, fn: fn()):
+        yield
+
 
-    def setup_method(self) -> None:
-        """Set up test environment."""
-        # Reset configuration before each test
-        reset_config()
-        # Reset singleton instance
-        AsyncioPySide6.reset_for_testing()
+@pytest.fixture
+def mock_qtasyncio() -> Iterator[Mock]:
+    """Replace QtAsyncio so that nothing starts a real Qt event loop."""
+    with patch("AsyncioPySide6.nvd.AsyncioPySide6.QtAsyncio") as mock:
+        yield mock
 
-    def teardown_method(self) -> None:
-        """Clean up after each test."""
-        # Reset configuration after each test
-        reset_config()
-        # Reset singleton instance
-        AsyncioPySide6.reset_for_testing()
+
+# Stand-in for a task's "work"; long enough to yield to the loop, short
+# enough not to dominate the suite's runtime
+_TEST_SLEEP = 0.001
+
+
+async def _noop_task(delay: float = _TEST_SLEEP, result: str = "Task completed") -> str:
+    """Shared coroutine for tests that only need a task to run to completion."""
+    await asyncio.sleep(delay)
+    return result
+
+
+async def _failing_task() -> str:
+    """Shared coroutine for tests that only need a task to fail."""
+    raise Exception("Test error")
+
+
+@pytest.mark.xdist_group("core")
+class TestAsyncioPySide6Core:
+    """Test core functionality of AsyncioPySide6."""
 
     def test_singleton_pattern(self) -> None:
         """Test that AsyncioPySide6 follows singleton pattern."""
@@ -53,9 +94,6 @@ class TestAsyncioPySide6Core:
 
     def test_initialization(self) -> None:
         """Test basic initialization."""
-        # Reset for testing
-        AsyncioPySide6.reset_for_testing()
-
         instance = AsyncioPySide6()
 
         # Should not be initialized by default
@@ -80,143 +118,222 @@ class TestAsyncioPySide6Core:
             with pytest.raises(ConfigurationError, match="QtAsyncio is not available"):
                 AsyncioPySide6()
 
-    def test_basic_task_execution(self) -> None:
+    def test_basic_task_execution(self, loop_runner: asyncio.Runner) -> None:
         """Test basic async task execution."""
         task_completed = False
 
         async def test_task() -> str:
             nonlocal task_completed
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(_TEST_SLEEP)
             task_completed = True
             return "Task completed"
 
         # Use asyncio.run to actually execute the task
         async def run_test() -> None:
             with AsyncioPySide6():
-                AsyncioPySide6.runTask(test_task())
-                # Wait for task to complete
-                await asyncio.sleep(0.2)
+                await AsyncioPySide6.runTask(test_task())
 
-        asyncio.run(run_test())
+        loop_runner.run(run_test())
         assert task_completed
 
-    def test_task_with_timeout_success(self) -> None:
+    def test_task_with_timeout_success(self, loop_runner: asyncio.Runner) -> None:
         """Test task with timeout that completes successfully."""
         task_completed = False
 
         async def test_task() -> str:
             nonlocal task_completed
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(_TEST_SLEEP)
             task_completed = True
             return "Task completed"
 
         # Use asyncio.run to actually execute the task
         async def run_test() -> None:
             with AsyncioPySide6():
-                AsyncioPySide6.runTaskWithTimeout(test_task(), timeout=1.0)
-                # Wait for task to complete
-                await asyncio.sleep(0.2)
+                await AsyncioPySide6.runTaskWithTimeout(test_task(), timeout=1.0)
 
-        asyncio.run(run_test())
+        loop_runner.run(run_test())
         assert task_completed
 
-    def test_task_with_timeout_failure(self) -> None:
-        """Test task with retry that fails after all attempts."""
+    def test_task_with_timeout_failure(self, loop_runner: asyncio.Runner) -> None:
+        """Test task with timeout that exceeds its deadline."""
+        task_cancelled = False
 
-        async def slow_task() -> str:
-            await asyncio.sleep(2.0)  # Takes longer than timeout
-            return "Task completed"
+        async def run_test() -> None:
+            # Gate the task on an event instead of a long sleep so nothing is
+            # left running once the loop closes.
+            release = asyncio.Event()
+
+            async def slow_task() -> str:
+                nonlocal task_cancelled
+                try:
+                    await release.wait()
+                except asyncio.CancelledError:
+                    task_cancelled = True
+                    raise
+                return "Task completed"
 
-        with AsyncioPySide6():
-            # This should not raise an exception in the test environment
-            # since we're not actually running the event loop
-            # Suppress the RuntimeWarning about unawaited coroutines
-            import warnings
+            with AsyncioPySide6():
+                AsyncioPySide6.runTaskWithTimeout(slow_task(), timeout=0.01)
+                # Wait past the deadline, then release the gate
+                await asyncio.sleep(0.05)
+                release.set()
+
+            assert AsyncioPySide6.get_task_count() == 0
+
+        loop_runner.run(run_test())
+        assert task_cancelled
+
+    def test_task_with_timeout_runs_in_single_task(self, loop_runner: asyncio.Runner) -> None:
+        """Test that the timeout wrapper does not spawn an extra child task."""
+
+        async def run_test() -> None:
+            release = asyncio.Event()
 
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
-                AsyncioPySide6.runTaskWithTimeout(slow_task(), timeout=0.1)
+            async def gated_task() -> str:
+                await release.wait()
+                return "Task completed"
 
-    def test_task_with_retry_success(self) -> None:
-        """Test task with retry that succeeds."""
+            with AsyncioPySide6():
+                baseline = len(asyncio.all_tasks())
+                AsyncioPySide6.runTaskWithTimeout(gated_task(), timeout=1.0)
+                await asyncio.sleep(_TEST_SLEEP)
+                # Only the wrapper task itself should be running
+                assert len(asyncio.all_tasks()) == baseline + 1
+                release.set()
+                await asyncio.sleep(_TEST_SLEEP)
+
+        loop_runner.run(run_test())
+
+    def test_timeout_tasks_share_one_deadline_sweeper(self, loop_runner: asyncio.Runner) -> None:
+        """Test that timed tasks share one timer armed for the earliest deadline."""
+
+        async def run_test() -> None:
+            release = asyncio.Event()
+
+            async def gated_task() -> None:
+                await release.wait()
+
+            with AsyncioPySide6() as manager:
+                for _ in range(3):
+                    AsyncioPySide6.runTaskWithTimeout(gated_task(), timeout=1.0)
+                await asyncio.sleep(_TEST_SLEEP)
+                assert len(manager._task_deadlines) == 3
+                sweeper = manager._deadline_handle
+                assert sweeper is not None
+                earliest = min(deadline for deadline, _ in manager._task_deadlines.values())
+                assert manager._deadline_at == earliest
+
+                # An earlier deadline re-arms the shared timer for it
+                short = AsyncioPySide6.runTaskWithTimeout(gated_task(), timeout=0.05)
+                await asyncio.sleep(_TEST_SLEEP)
+                assert manager._deadline_handle is not sweeper
+                assert manager._deadline_at < earliest
+
+                # Once it fires, the timer moves on to the next deadline
+                with pytest.raises(TaskTimeoutError):
+                    await short
+                assert manager._deadline_at == earliest
+
+                release.set()
+                await asyncio.sleep(_TEST_SLEEP)
+                # Finished tasks drop their deadline without touching the timer
+                assert manager._task_deadlines == {}
+                assert manager._deadline_at == earliest
+
+        loop_runner.run(run_test())
+
+    def test_run_task_returns_awaitable_future(self, loop_runner: asyncio.Runner) -> None:
+        """Test that scheduled tasks can be awaited instead of slept on."""
+
+        async def run_test() -> None:
+            with AsyncioPySide6():
+                future = AsyncioPySide6.runTask(_noop_task(delay=0))
+                assert await future == "Task completed"
+
+                future = AsyncioPySide6.runTaskWithTimeout(asyncio.sleep(1.0), timeout=0.01)
+                with pytest.raises(TaskTimeoutError):
+                    await future
+
+        loop_runner.run(run_test())
+
+    def test_scheduled_tasks_get_unique_int_ids(self, loop_runner: asyncio.Runner) -> None:
+        """Test that scheduled tasks are tracked under distinct integer ids."""
+
+        async def run_test() -> None:
+            release = asyncio.Event()
+            with AsyncioPySide6() as manager:
+                futures = [AsyncioPySide6.runTask(release.wait()) for _ in range(2)]
+                task_ids = set(manager._active_tasks)
+                assert len(task_ids) == 2
+                assert all(isinstance(task_id, int) for task_id in task_ids)
+                release.set()
+                await asyncio.gather(*futures)
+
+        loop_runner.run(run_test())
+
+    @pytest.mark.parametrize(
+        "max_retries, succeed_on, expected_attempts",
+        [
+            (3, 3, 3),  # recovers on a later attempt
+            (2, None, 3),  # fails every attempt
+            (0, 1, 1),  # succeeds first time without retrying
+            (0, None, 1),  # fails with retries disabled
+        ],
+    )
+    def test_task_with_retry(
+        self, loop_runner: asyncio.Runner, max_retries: int, succeed_on: Optional[int], expected_attempts: int
+    ) -> None:
+        """Test retry outcomes and attempt counts."""
         attempt_count = 0
 
         async def flaky_task() -> str:
             nonlocal attempt_count
             attempt_count += 1
-            if attempt_count < 3:
+            if attempt_count != succeed_on:
                 raise Exception("Simulated failure")
             return "Task succeeded"
 
-        # Use asyncio.run to actually execute the task
         async def run_test() -> None:
             with AsyncioPySide6():
-                AsyncioPySide6.runTaskWithRetry(lambda: flaky_task(), max_retries=3, retry_delay=0.1)
-                # Wait for task to complete
-                await asyncio.sleep(0.5)
-
-        asyncio.run(run_test())
-        assert attempt_count == 3
-
-    def test_task_with_retry_failure(self) -> None:
-        """Test task with retry that fails after all attempts."""
-
-        async def always_failing_task() -> str:
-            raise Exception("Always fails")
-
-        with AsyncioPySide6():
-            # This should not raise an exception in the test environment
-            # since we're not actually running the event loop
-            AsyncioPySide6.runTaskWithRetry(lambda: always_failing_task(), max_retries=2, retry_delay=0.1)
-
-    def test_task_with_progress(self) -> None:
+                future = AsyncioPySide6.runTaskWithRetry(flaky_task, max_retries=max_retries, retry_delay=_TEST_SLEEP)
+                if succeed_on is None:
+                    with pytest.raises(TaskExecutionError, match=f"after {expected_attempts} attempts"):
+                        await future
+                else:
+                    assert await future == "Task succeeded"
+
+        loop_runner.run(run_test())
+        assert attempt_count == expected_attempts
+
+    @pytest.mark.usefixtures("inline_qtimer")
+    def test_task_with_progress(self, loop_runner: asyncio.Runner) -> None:
         """Test task with progress tracking."""
         progress_values = []
 
         def progress_callback(progress: float) -> None:
             progress_values.append(progress)
 
-        async def progress_task() -> str:
-            await asyncio.sleep(0.1)
-            return "Task completed"
-
         # Use asyncio.run to actually execute the task
         async def run_test() -> None:
             with AsyncioPySide6():
-                AsyncioPySide6.runTaskWithProgress(progress_task(), progress_callback)
-                # Wait for task to complete
-                await asyncio.sleep(0.2)
-
-        asyncio.run(run_test())
-
-        # The progress callback should be called at least at start (0.0) and end (1.0)
-        # But if there's no event loop, it might not be called at all
-        # So we'll check if it was called, but not require it
-        if len(progress_values) >= 2:
-            assert 0.0 in progress_values
-            assert 1.0 in progress_values
-        else:
-            # If no progress values were captured, that's okay in test environment
-            # Just log it for debugging
-            print(f"Progress values captured: {progress_values}")
+                await AsyncioPySide6.runTaskWithProgress(_noop_task(), progress_callback)
+
+        loop_runner.run(run_test())
 
+        # Reported at start and end of the task
+        assert progress_values[0] == 0.0
+        assert progress_values[-1] == 1.0
+
+    @pytest.mark.usefixtures("inline_qtimer")
     def test_gui_thread_invocation(self) -> None:
         """Test GUI thread invocation."""
-        gui_object = Mock()
-        callback_called = False
-
-        def test_callback() -> None:
-            nonlocal callback_called
-            callback_called = True
+        done = threading.Event()
 
         with AsyncioPySide6():
-            AsyncioPySide6.invokeInGuiThread(gui_object, test_callback)
-
-            # Wait a bit for callback to be called
-            time.sleep(0.1)
+            AsyncioPySide6.invokeInGuiThread(_GUI_OBJ_SENTINEL, done.set)
 
-            # In test environment, this might not actually be called
-            # but the method should not raise an exception
+            # Returns as soon as the callback has run
+            assert done.wait(timeout=0.1)
 
     def test_health_status(self) -> None:
         """Test health status functionality."""
@@ -272,21 +389,38 @@ class TestAsyncioPySide6Core:
         assert not manager.is_initialized()
         assert len(manager._active_tasks) == 0
 
+    def test_cleanup_leaves_tasks_running(self, loop_runner: asyncio.Runner) -> None:
+        """Test that leaving the context stops tracking tasks without cancelling them."""
+
+        async def run_test() -> None:
+            release = asyncio.Event()
+            with AsyncioPySide6() as manager:
+                plain = AsyncioPySide6.runTask(release.wait())
+                timed = AsyncioPySide6.runTaskWithTimeout(release.wait(), timeout=1.0)
+                await asyncio.sleep(_TEST_SLEEP)
+
+            assert manager._active_tasks == set()
+            assert not plain.done() and not timed.done()
+            release.set()
+            assert await plain is True
+            assert await timed is True
+
+        loop_runner.run(run_test())
+
     def test_error_handling(self) -> None:
         """Test error handling in task execution."""
 
-        async def failing_task() -> str:
-            raise Exception("Test error")
-
         with AsyncioPySide6():
             # This should not raise an exception in the test environment
             # since we're not actually running the event loop
-            # Suppress the RuntimeWarning about unawaited coroutines
-            import warnings
+            AsyncioPySide6.runTask(_failing_task())
 
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
-                AsyncioPySide6.runTask(failing_task())
+    def test_deprecated_memory_error_alias(self) -> None:
+        """Test the old MemoryError name still resolves, with a warning."""
+        with pytest.warns(DeprecationWarning, match="MemoryLimitExceededError"):
+            assert exceptions.MemoryError is MemoryLimitExceededError
+        assert issubclass(MemoryLimitExceededError, AsyncioPySide6Error)
+        assert MemoryLimitExceededError is not MemoryError
 
     def test_configuration_validation(self) -> None:
         """Test configuration validation."""
@@ -304,9 +438,6 @@ class TestAsyncioPySide6Core:
 
     def test_static_methods(self) -> None:
         """Test static method functionality."""
-        # Reset for testing
-        AsyncioPySide6.reset_for_testing()
-
         # Test is_initialized
         assert not AsyncioPySide6.is_initialized()
 
@@ -318,199 +449,89 @@ class TestAsyncioPySide6Core:
         task_count = AsyncioPySide6.get_task_count()
         assert isinstance(task_count, int)
 
-    def test_run_with_qtasyncio(self) -> None:
+    def test_run_with_qtasyncio(self, mock_qtasyncio: Mock) -> None:
         """Test running with QtAsyncio integration."""
-
-        async def test_coro() -> str:
-            await asyncio.sleep(0.1)
-            return "Test result"
+        mock_qtasyncio.run.return_value = "Test result"
 
         with AsyncioPySide6() as manager:
-            # This should not raise an exception in the test environment
-            # since we're not actually running the event loop
-            # Suppress the RuntimeWarning about unawaited coroutines
-            import warnings
-
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
-                # Mock QtAsyncio to avoid actual execution
-                with patch("AsyncioPySide6.nvd.AsyncioPySide6.QtAsyncio") as mock_qtasyncio:
-                    mock_qtasyncio.run.return_value = "Test result"
-                    result = manager.run_with_qtasyncio(
-                        Mock(),  # app parameter
-                        test_coro(),
-                        keep_running=True,
-                        quit_qapp=True,
-                        handle_sigint=False,
-                        debug=None,
-                    )
-                    assert result == "Test result"
+            result = manager.run_with_qtasyncio(
+                _APP_SENTINEL,
+                _noop_task(result="Test result"),
+                keep_running=True,
+                quit_qapp=True,
+                handle_sigint=False,
+                debug=None,
+            )
+            assert result == "Test result"
 
 
-class TestAsyncioPySide6Integration:
-    """Test integration scenarios."""
+    def test_package_app_is_instance_after_submodule_import(self) -> None:
+        """Test that importing the app submodule keeps the package's app bound to the App instance."""
+        import importlib
+
+        package = importlib.import_module("pyside6_asyncplus")
+        importlib.import_module("pyside6_asyncplus.app")
+        assert isinstance(package.app, package.App)
 
-    def setup_method(self) -> None:
-        """Set up test environment."""
-        reset_config()
-        AsyncioPySide6.reset_for_testing()
 
-    def teardown_method(self) -> None:
-        """Clean up after each test."""
-        reset_config()
-        AsyncioPySide6.reset_for_testing()
+@pytest.mark.xdist_group("integration")
+class TestAsyncioPySide6Integration:
+    """Test integration scenarios."""
 
-    def test_multiple_tasks(self) -> None:
+    def test_multiple_tasks(self, loop_runner: asyncio.Runner) -> None:
         """Test running multiple tasks simultaneously."""
         task_results = []
 
         async def task_1() -> str:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(_TEST_SLEEP)
             task_results.append("Task 1")
             return "Task 1"
 
         async def task_2() -> str:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(_TEST_SLEEP)
             task_results.append("Task 2")
             return "Task 2"
 
         # Use asyncio.run to actually execute the tasks
         async def run_test() -> None:
             with AsyncioPySide6():
-                AsyncioPySide6.runTask(task_1())
-                AsyncioPySide6.runTask(task_2())
-                # Wait for tasks to complete
-                await asyncio.sleep(0.3)
+                await asyncio.gather(AsyncioPySide6.runTask(task_1()), AsyncioPySide6.runTask(task_2()))
 
-        asyncio.run(run_test())
+        loop_runner.run(run_test())
         assert "Task 1" in task_results
         assert "Task 2" in task_results
 
-    def test_task_chain(self) -> None:
+    def test_task_chain(self, loop_runner: asyncio.Runner) -> None:
         """Test chaining multiple tasks."""
         results = []
 
         async def task_1() -> str:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(_TEST_SLEEP)
             results.append("Task 1")
             return "Task 1"
 
         async def task_2() -> str:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(_TEST_SLEEP)
             results.append("Task 2")
             return "Task 2"
 
         async def task_3() -> str:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(_TEST_SLEEP)
             results.append("Task 3")
             return "Task 3"
 
         # Use asyncio.run to actually execute the tasks
         async def run_test() -> None:
             with AsyncioPySide6():
-                AsyncioPySide6.runTask(task_1())
-                AsyncioPySide6.runTask(task_2())
-                AsyncioPySide6.runTask(task_3())
-                # Wait for tasks to complete
-                await asyncio.sleep(0.4)
+                await asyncio.gather(
+                    AsyncioPySide6.runTask(task_1()),
+                    AsyncioPySide6.runTask(task_2()),
+                    AsyncioPySide6.runTask(task_3()),
+                )
 
-        asyncio.run(run_test())
+        loop_runner.run(run_test())
         assert results == ["Task 1", "Task 2", "Task 3"]
 
-    def test_error_recovery(self) -> None:
-        """Test error recovery scenarios."""
-        success_count = 0
-
-        async def flaky_task() -> str:
-            nonlocal success_count
-            success_count += 1
-            if success_count < 3:
-                raise Exception("Simulated failure")
-            return "Task succeeded"
-
-        # Use asyncio.run to actually execute the task
-        async def run_test() -> None:
-            with AsyncioPySide6():
-                AsyncioPySide6.runTaskWithRetry(lambda: flaky_task(), max_retries=3, retry_delay=0.1)
-                # Wait for task to complete
-                await asyncio.sleep(0.5)
-
-        asyncio.run(run_test())
-        assert success_count == 3
-
-
-class TestAsyncioPySide6Configuration:
-    """Test configuration functionality."""
-
-    def setup_method(self) -> None:
-        """Set up test environment."""
-        reset_config()
-
-    def teardown_method(self) -> None:
-        """Clean up after each test."""
-        reset_config()
-
-    def test_default_configuration(self) -> None:
-        """Test default configuration values."""
-        config = get_config()
-
-        assert config.task_timeout == 30.0
-        assert config.max_retries == 3
-        assert config.retry_delay == 0.1
-        assert config.enable_logging == True
-        assert config.log_level == "INFO"
-
-    def test_configuration_modification(self) -> None:
-        """Test modifying configuration."""
-        config = get_config()
-
-        # Modify configuration
-        config.task_timeout = 60.0
-        config.max_retries = 5
-        config.enable_debug_mode = True
-
-        set_config(config)
-
-        # Verify changes
-        new_config = get_config()
-        assert new_config.task_timeout == 60.0
-        assert new_config.max_retries == 5
-        assert new_config.enable_debug_mode == True
-
-    def test_configuration_reset(self) -> None:
-        """Test resetting configuration to defaults."""
-        config = get_config()
-        config.task_timeout = 999.0
-        set_config(config)
-
-        # Reset to defaults
-        reset_config()
-
-        # Verify reset
-        config = get_config()
-        assert config.task_timeout == 30.0
-
-    def test_configuration_validation(self) -> None:
-        """Test configuration validation."""
-        config = get_config()
-
-        # Test valid values
-        config.task_timeout = 10.0
-        config.max_retries = 2
-        config.retry_delay = 0.5
-
-        # Should not raise exception
-        config._validate_config()
-
-        # Test invalid values
-        with pytest.raises(ValueError):
-            config.task_timeout = -1.0
-            config._validate_config()
-
-        with pytest.raises(ValueError):
-            config.max_retries = -1
-            config._validate_config()
-
 
 if __name__ == "__main__":
     pytest.main([__file__])
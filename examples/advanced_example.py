@@ -7,20 +7,38 @@ It shows performance monitoring, health checks, progress tracking, and complex a
 """
 
 import asyncio
+import functools
 import sys
 import time
 import random
-from typing import List, Dict, Any
+from dataclasses import dataclass
+
+import psutil
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, 
     QPushButton, QLabel, QTextEdit, QProgressBar, QGroupBox, QGridLayout
 )
-from PySide6.QtCore import QTimer, QThread, QObject
+from PySide6.QtCore import QTimer
+from PySide6 import QtAsyncio
 
 # Import our enhanced pyside6-asyncplus
 sys.path.append('..')
-from pyside6_asyncplus.app import app as async_app, run, run_with_progress, run_with_retry, invoke_in_gui_thread
+from pyside6_asyncplus.app import app as async_app, run, run_with_progress, run_with_retry
 from pyside6_asyncplus import get_config, set_config, get_health_status
+from pyside6_asyncplus.nvd.performance import (
+    PerformanceMetrics, get_performance_monitor, start_performance_monitoring
+)
+
+
+@dataclass(slots=True)
+class TaskCounters:
+    """Task counters updated as tracked tasks start and finish."""
+    
+    active: int = 0
+    completed: int = 0
+    failed: int = 0
+    # Share of finished tasks that succeeded, refreshed only when a task finishes
+    rate: float = 1.0
 
 
 class AdvancedExample(QMainWindow):
@@ -53,16 +71,27 @@ class AdvancedExample(QMainWindow):
         self._create_progress_section(main_layout)
         self._create_log_section(main_layout)
         
-        # Initialize timers and counters
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_status)
-        self.timer.start(1000)  # Update every second
+        # Status tick counter, advanced by status_loop()
         self.timer_count = 0
         
         # Task tracking
-        self.active_tasks = 0
-        self.completed_tasks = 0
-        self.failed_tasks = 0
+        self.counters = TaskCounters()
+        # Private generator for the simulated workloads
+        self._rng = random.Random()
+        
+        # Cache the process handle and total RAM; neither changes while running
+        self._proc = psutil.Process()
+        self._total_mem = psutil.virtual_memory().total
+        # Prime the CPU baseline so the first real sample isn't a wasted 0.0
+        self._proc.cpu_percent(interval=None)
+        self._last_mem = self._sample_mem()
+        self._label_cache = {}
+        
+        # Coalesce log messages into one append per 50ms
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
         
         # Initialize pyside6-asyncplus with performance monitoring
         self._setup_asyncio()
@@ -162,6 +191,8 @@ class AdvancedExample(QMainWindow):
         
         self.log_text = QTextEdit()
         self.log_text.setMaximumHeight(200)
+        # Drop the oldest lines so long stress runs don't grow the document forever
+        self.log_text.document().setMaximumBlockCount(500)
         log_layout.addWidget(self.log_text)
         
         parent_layout.addWidget(log_group)
@@ -179,10 +210,11 @@ class AdvancedExample(QMainWindow):
         
         # Start performance monitoring (handle event loop issues gracefully)
         try:
-            from pyside6_asyncplus.nvd.performance import start_performance_monitoring
             start_performance_monitoring()
+            self._monitoring_ok = True
             self.log("pyside6-asyncplus initialized with performance monitoring")
         except Exception as e:
+            self._monitoring_ok = False
             self.log(f"Performance monitoring initialization failed: {e}")
             self.log("Continuing without performance monitoring...")
     
@@ -192,12 +224,29 @@ class AdvancedExample(QMainWindow):
         Args:
             message: The message to log
         """
-        self.log_text.append(f"[{self.timer_count}s] {message}")
+        self._log_buf.append(f"[{self.timer_count}s] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start(50)
+    
+    def _flush_log(self):
+        """Append all buffered log messages in a single layout pass."""
+        if self._log_buf:
+            self.log_text.append("\n".join(self._log_buf))
+            self._log_buf.clear()
+    
+    def _sample_mem(self):
+        """Read the process memory usage.
+        
+        Returns:
+            Tuple of (percentage of total RAM, resident size in MB)
+        """
+        with self._proc.oneshot():
+            memory_info = self._proc.memory_info()
+        return memory_info.rss * 100.0 / self._total_mem, memory_info.rss / 1024 / 1024
     
     def update_metrics(self):
         """Update performance metrics manually."""
         try:
-            from pyside6_asyncplus.nvd.performance import get_performance_monitor
             monitor = get_performance_monitor()
 
             # Check if the monitor has the _has_event_loop method
@@ -209,22 +258,22 @@ class AdvancedExample(QMainWindow):
             else:
                 # Fallback: try to create a basic metric
                 try:
-                    import psutil
-                    process = psutil.Process()
-                    memory_info = process.memory_info()
+                    # oneshot() lets both calls share a single /proc read
+                    with self._proc.oneshot():
+                        memory_info = self._proc.memory_info()
+                        cpu_percent = self._proc.cpu_percent(interval=0.0)
                     memory_usage_mb = memory_info.rss / 1024 / 1024
-                    memory_percentage = (memory_info.rss / psutil.virtual_memory().total) * 100
+                    memory_percentage = (memory_info.rss / self._total_mem) * 100
                     
-                    from pyside6_asyncplus.nvd.performance import PerformanceMetrics
                     initial_metric = PerformanceMetrics(
                         timestamp=time.time(),
-                        active_tasks=self.active_tasks,
+                        active_tasks=self.counters.active,
                         memory_usage_mb=memory_usage_mb,
                         memory_percentage=memory_percentage,
                         event_loop_latency_ms=0.0,
                         task_completion_rate=0.0,
                         error_rate=0.0,
-                        cpu_usage_percentage=process.cpu_percent()
+                        cpu_usage_percentage=cpu_percent
                     )
                     monitor.metrics_history.append(initial_metric)
                 except Exception as e:
@@ -232,72 +281,109 @@ class AdvancedExample(QMainWindow):
         except Exception as e:
             self.log(f"Error updating metrics: {e}")
 
+    def _set_label(self, label, text):
+        """Set label text only when it changed, avoiding needless relayouts.
+        
+        Args:
+            label: The QLabel to update
+            text: The new text
+        """
+        if self._label_cache.get(id(label)) != text:
+            label.setText(text)
+            self._label_cache[id(label)] = text
+    
+    def _render_sampled_memory(self):
+        """Show memory usage read directly from the process."""
+        try:
+            # Memory doesn't need per-second resolution; sample every 5 ticks
+            if self.timer_count % 5 == 0:
+                self._last_mem = self._sample_mem()
+            memory_percent, memory_mb = self._last_mem
+            self._set_label(self.memory_label, f"Memory: {memory_percent:.1f}% ({memory_mb:.1f}MB)")
+        except Exception:
+            self._set_label(self.memory_label, "Memory: Unknown")
+    
+    def _render_no_metrics(self):
+        """Fill the memory and performance labels when no metrics are available."""
+        self._render_sampled_memory()
+        
+        # Fallback performance based on task completion (100% until a task has run)
+        self._set_label(self.performance_label, f"Performance: {self.counters.rate * 100:.1f}%")
+    
+    def _render_metrics(self, metrics):
+        """Fill the memory and performance labels from monitor metrics.
+        
+        Args:
+            metrics: The metrics dict from the health status
+        """
+        memory_percent = metrics.get('memory_percentage', 0)
+        memory_mb = metrics.get('memory_usage_mb', 0)
+        if memory_percent == 0 and memory_mb == 0:
+            self._render_sampled_memory()
+        else:
+            self._set_label(self.memory_label, f"Memory: {memory_percent:.1f}% ({memory_mb:.1f}MB)")
+        
+        # Calculate performance as a combination of completion rate and low error rate
+        completion_rate = metrics.get('task_completion_rate', 0)
+        error_rate = metrics.get('error_rate', 0)
+        if completion_rate > 0:
+            performance_score = (completion_rate * 100) - (error_rate * 100)
+        else:
+            # If no completion rate, base it on error rate and active tasks
+            performance_score = max(0, 100 - (error_rate * 100))
+        self._set_label(self.performance_label, f"Performance: {performance_score:.1f}%")
+    
+    def _render_error(self, error):
+        """Show that the health status could not be read.
+        
+        Args:
+            error: The exception raised by get_health_status
+        """
+        self.log(f"Error getting health status: {error}")
+        self._set_label(self.health_status_label, "Health: Error")
+        self._set_label(self.memory_label, "Memory: Error")
+        self._set_label(self.performance_label, "Performance: Error")
+    
+    async def status_loop(self):
+        """Refresh the status section once per second for the life of the window."""
+        while True:
+            await asyncio.sleep(1.0)
+            self.update_status()
+    
     def update_status(self):
         """Update status information."""
         self.timer_count += 1
         
+        # Nothing to show while hidden or minimized; keep only the clock ticking
+        if not self.isVisible() or self.isMinimized():
+            return
+        
         # Update metrics periodically
         if self.timer_count % 5 == 0:  # Update every 5 seconds
             self.update_metrics()
         
         # Update task counts
-        self.task_count_label.setText(f"Tasks: {self.active_tasks}")
+        self._set_label(self.task_count_label, f"Tasks: {self.counters.active}")
+        
+        # Without monitoring the health status has no real data to offer
+        if not self._monitoring_ok:
+            self._render_no_metrics()
+            return
         
         # Get health status
         try:
             health = get_health_status()
-            status = health.get('status', 'Unknown')
-            self.health_status_label.setText(f"Health: {status}")
-            
-            # Get memory and performance from metrics if available
-            metrics = health.get('metrics', {})
-            memory_percent = metrics.get('memory_percentage', 0)
-            memory_mb = metrics.get('memory_usage_mb', 0)
-            
-            # If no metrics available, try to get basic memory info
-            if memory_percent == 0 and memory_mb == 0:
-                try:
-                    import psutil
-                    process = psutil.Process()
-                    memory_info = process.memory_info()
-                    memory_mb = memory_info.rss / 1024 / 1024
-                    memory_percent = (memory_info.rss / psutil.virtual_memory().total) * 100
-                    self.memory_label.setText(f"Memory: {memory_percent:.1f}% ({memory_mb:.1f}MB)")
-                except Exception:
-                    self.memory_label.setText("Memory: Unknown")
-            else:
-                self.memory_label.setText(f"Memory: {memory_percent:.1f}% ({memory_mb:.1f}MB)")
-            
-            # Calculate performance score
-            if metrics:
-                completion_rate = metrics.get('task_completion_rate', 0)
-                error_rate = metrics.get('error_rate', 0)
-                # Calculate performance as a combination of completion rate and low error rate
-                if completion_rate > 0:
-                    performance_score = (completion_rate * 100) - (error_rate * 100)
-                else:
-                    # If no completion rate, base it on error rate and active tasks
-                    performance_score = max(0, 100 - (error_rate * 100))
-                self.performance_label.setText(f"Performance: {performance_score:.1f}%")
-            else:
-                # Fallback performance calculation based on task completion
-                if self.completed_tasks > 0 or self.failed_tasks > 0:
-                    total_tasks = self.completed_tasks + self.failed_tasks
-                    if total_tasks > 0:
-                        completion_rate = self.completed_tasks / total_tasks
-                        performance_score = completion_rate * 100
-                        self.performance_label.setText(f"Performance: {performance_score:.1f}%")
-                    else:
-                        self.performance_label.setText("Performance: 0.0%")
-                else:
-                    # If no tasks have been run, show a default value
-                    self.performance_label.setText("Performance: 100.0%")
-                
         except Exception as e:
-            self.log(f"Error getting health status: {e}")
-            self.health_status_label.setText("Health: Error")
-            self.memory_label.setText("Memory: Error")
-            self.performance_label.setText("Performance: Error")
+            self._render_error(e)
+            return
+        
+        self._set_label(self.health_status_label, f"Health: {health.get('status', 'Unknown')}")
+        metrics = health.get('metrics')
+        if metrics:
+            self._render_metrics(metrics)
+        else:
+            # Nothing from the monitor yet; skip the metrics branch entirely
+            self._render_no_metrics()
     
     async def basic_async_task(self):
         """Basic async task with logging.
@@ -346,7 +432,7 @@ class AdvancedExample(QMainWindow):
         self.log(f"Starting concurrent task {task_id}...")
         
         # Simulate variable work time
-        work_time = random.uniform(1, 3)
+        work_time = self._rng.uniform(1, 3)
         await asyncio.sleep(work_time)
         
         self.log(f"Concurrent task {task_id} completed!")
@@ -364,106 +450,119 @@ class AdvancedExample(QMainWindow):
         self.log(f"Starting stress task {task_id}...")
         
         # Simulate potential failure
-        if random.random() < 0.1:  # 10% chance of failure
+        if self._rng.random() < 0.1:  # 10% chance of failure
             raise Exception(f"Stress task {task_id} failed randomly")
         
         # Simulate CPU-intensive work
-        work_time = random.uniform(0.5, 2.0)
+        work_time = self._rng.uniform(0.5, 2.0)
         await asyncio.sleep(work_time)
         
         self.log(f"Stress task {task_id} completed!")
         return f"Stress task {task_id} completed"
     
+    async def _tracked(self, awaitable, on_done=None):
+        """Await a task while keeping the task counters in step with it.
+        
+        Args:
+            awaitable: The coroutine or future to await
+            on_done: Optional callable run once the task has finished
+            
+        Returns:
+            The awaited result
+        """
+        self.counters.active += 1
+        try:
+            result = await awaitable
+        except Exception:
+            self.counters.failed += 1
+            raise
+        else:
+            self.counters.completed += 1
+            return result
+        finally:
+            self.counters.active -= 1
+            finished = self.counters.completed + self.counters.failed
+            if finished:  # zero if the first task was cancelled
+                self.counters.rate = self.counters.completed / finished
+            if on_done is not None:
+                on_done()
+    
     def run_basic_task(self):
         """Run a basic async task."""
         self.log("=== Running Basic Task ===")
-        self.active_tasks += 1
-        
-        def on_complete():
-            """Handle task completion."""
-            self.active_tasks -= 1
-            self.completed_tasks += 1
-            self.log("Basic task completed in GUI thread")
-        
-        run(self.basic_async_task())
-        QTimer.singleShot(2500, on_complete)  # Schedule completion callback
+        run(self._tracked(
+            self.basic_async_task(),
+            lambda: self.log("Basic task completed in GUI thread")
+        ))
     
     def run_progress_task(self):
         """Run a task with progress tracking."""
         self.log("=== Running Progress Task ===")
-        self.active_tasks += 1
         
         # Show progress bar
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.progress_label.setText("Progress task running...")
         
+        last_value = -1
+        
         def progress_callback(progress: float):
             """Update progress bar in GUI thread.
             
             Args:
                 progress: Progress value between 0.0 and 1.0
             """
+            nonlocal last_value
             # Ensure progress is within bounds
-            progress = max(0.0, min(1.0, progress))
-            # Use QTimer to ensure GUI thread execution
-            QTimer.singleShot(0, lambda: self.progress_bar.setValue(int(progress * 100)))
+            value = int(max(0.0, min(1.0, progress)) * 100)
+            # Both the task and the library report progress; skip repeats
+            if value == last_value:
+                return
+            last_value = value
+            # The asyncio loop runs on the Qt event loop, so this is already the GUI thread
+            self.progress_bar.setValue(value)
         
         def on_complete():
             """Handle task completion."""
-            self.active_tasks -= 1
-            self.completed_tasks += 1
             self.progress_bar.setVisible(False)
             self.progress_label.setText("Progress task completed!")
             self.log("Progress task completed in GUI thread")
         
         run_with_progress(
-            self.progress_async_task(progress_callback),
+            self._tracked(self.progress_async_task(progress_callback), on_complete),
             progress_callback
         )
-        QTimer.singleShot(6000, on_complete)  # Schedule completion callback
     
     def run_concurrent_tasks(self):
         """Run multiple concurrent tasks."""
         self.log("=== Running Concurrent Tasks ===")
         num_tasks = 5
-        self.active_tasks += num_tasks
         
-        def on_complete():
-            """Handle task completion."""
-            self.active_tasks -= num_tasks
-            self.completed_tasks += num_tasks
+        async def run_all():
+            """Run every concurrent task from a single submitted coroutine."""
+            await asyncio.gather(*(self._tracked(self.concurrent_task(i + 1)) for i in range(num_tasks)))
             self.log("All concurrent tasks completed in GUI thread")
         
-        # Run multiple concurrent tasks
-        for i in range(num_tasks):
-            run(self.concurrent_task(i + 1))
-        
-        # Schedule completion callback
-        QTimer.singleShot(4000, on_complete)  # Schedule completion callback
+        run(run_all())
     
     def run_stress_test(self):
         """Run stress test with multiple tasks and retry logic."""
         self.log("=== Running Stress Test ===")
         num_tasks = 10
-        self.active_tasks += num_tasks
         
-        def on_complete():
-            """Handle task completion."""
-            self.active_tasks -= num_tasks
-            self.completed_tasks += num_tasks
-            self.log("Stress test completed in GUI thread")
-        
-        # Run stress test tasks with retry logic
+        # Run stress test tasks with retry logic; partial binds i now, a lambda
+        # would see the loop's final value by the time the retry wrapper calls it
         for i in range(num_tasks):
-            run_with_retry(
-                lambda: self.stress_task(i + 1),
+            retry_task = run_with_retry(
+                functools.partial(self.stress_task, i + 1),
                 max_retries=2,
                 retry_delay=0.5
             )
-        
-        # Schedule completion callback
-        QTimer.singleShot(5000, on_complete)  # Schedule completion callback
+            # None means no event loop was running, so there is nothing to await
+            if retry_task is None:
+                self.log(f"Stress task {i + 1} could not be scheduled")
+                continue
+            run(self._tracked(retry_task))
     
     def show_configuration(self):
         """Show current configuration."""
@@ -489,9 +588,10 @@ def main():
     example = AdvancedExample()
     example.show()
     
-    # Run the application with pyside6-asyncplus
+    # Run the Qt event loop through QtAsyncio so tasks have a running asyncio loop;
+    # the status refresh runs as a coroutine on that loop rather than a QTimer
     with async_app:
-        sys.exit(app.exec())
+        QtAsyncio.run(example.status_loop(), handle_sigint=True)
 
 
 if __name__ == "__main__":
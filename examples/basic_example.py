@@ -7,13 +7,16 @@ It shows how to run simple async tasks, handle timeouts, and use retry logic.
 """
 
 import asyncio
+import random
 import sys
 from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton, QLabel, QTextEdit
 from PySide6.QtCore import QTimer
+from PySide6 import QtAsyncio
 
 # Import our enhanced pyside6-asyncplus
 sys.path.append('..')
-from pyside6_asyncplus.app import app as async_app, run, run_with_timeout, run_with_retry, invoke_in_gui_thread
+from pyside6_asyncplus.app import app as async_app, run, run_with_timeout, run_with_retry
+from pyside6_asyncplus import TaskExecutionError, TaskTimeoutError
 
 
 class BasicExample(QMainWindow):
@@ -46,24 +49,47 @@ class BasicExample(QMainWindow):
         self.log_text.setMaximumHeight(200)
         layout.addWidget(self.log_text)
         
+        # Running button handler tasks; asyncio only keeps weak references to
+        # tasks, so they are held here until they finish
+        self._handler_tasks = set()
+        
         # Create buttons
         self.basic_task_btn = QPushButton("Run Basic Task")
-        self.basic_task_btn.clicked.connect(self.run_basic_task)
+        self.basic_task_btn.clicked.connect(lambda: self._start_handler(self.run_basic_task()))
         layout.addWidget(self.basic_task_btn)
         
         self.timeout_task_btn = QPushButton("Run Task with Timeout")
-        self.timeout_task_btn.clicked.connect(self.run_timeout_task)
+        self.timeout_task_btn.clicked.connect(lambda: self._start_handler(self.run_timeout_task()))
         layout.addWidget(self.timeout_task_btn)
         
         self.retry_task_btn = QPushButton("Run Task with Retry")
-        self.retry_task_btn.clicked.connect(self.run_retry_task)
+        self.retry_task_btn.clicked.connect(lambda: self._start_handler(self.run_retry_task()))
         layout.addWidget(self.retry_task_btn)
         
-        # Add a timer to demonstrate the event loop is working
+        # Add a timer to demonstrate the event loop is working; it only runs
+        # while the window is shown (see showEvent/hideEvent)
         self.timer = QTimer()
+        self.timer.setInterval(1000)  # Update every second
         self.timer.timeout.connect(self.update_timer)
-        self.timer.start(1000)  # Update every second
         self.timer_count = 0
+        
+        # Coalesce log messages into one append per 50ms
+        self._log_buf = []
+        # (timer_count, "[Ns] ") so bursts within a second reuse one prefix
+        self._log_prefix = (-1, "")
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+    
+    def showEvent(self, event):
+        """Start the status timer when the window is shown."""
+        self.timer.start()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        """Stop the status timer while the window is hidden."""
+        self.timer.stop()
+        super().hideEvent(event)
     
     def log(self, message: str):
         """Add message to log with timestamp.
@@ -71,7 +97,33 @@ class BasicExample(QMainWindow):
         Args:
             message: The message to log
         """
-        self.log_text.append(f"[{self.timer_count}s] {message}")
+        if self._log_prefix[0] != self.timer_count:
+            self._log_prefix = (self.timer_count, f"[{self.timer_count}s] ")
+        self._log_buf.append(self._log_prefix[1] + message)
+        if not self._log_timer.isActive():
+            self._log_timer.start(50)
+    
+    def _flush_log(self):
+        """Append all buffered log messages in a single layout pass."""
+        if self._log_buf:
+            self.log_text.append("\n".join(self._log_buf))
+            self._log_buf.clear()
+    
+    def _start_handler(self, coro):
+        """Schedule a button handler coroutine and keep its task alive until done.
+        
+        Args:
+            coro: The handler coroutine to run
+        """
+        task = asyncio.ensure_future(coro)
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_done)
+    
+    def _handler_done(self, task):
+        """Drop a finished handler task and log any exception it raised."""
+        self._handler_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.log(f"Handler failed: {task.exception()}")
     
     def update_timer(self):
         """Update timer counter to show event loop is working."""
@@ -110,7 +162,6 @@ class BasicExample(QMainWindow):
         Returns:
             str: Result message
         """
-        import random
         self.log("Starting retry async task...")
         
         # Simulate random failure (70% chance of failure)
@@ -121,57 +172,53 @@ class BasicExample(QMainWindow):
         self.log("Retry async task completed!")
         return "Retry task completed successfully"
     
-    def run_basic_task(self):
+    async def run_basic_task(self):
         """Run a basic async task."""
         self.log("=== Running Basic Task ===")
         self.status_label.setText("Status: Running basic task...")
         
-        def update_gui():
-            """Update GUI after task completion."""
-            self.status_label.setText("Status: Basic task completed!")
-            self.log("GUI updated: Basic task completed!")
-        
-        # Run the task using pyside6-asyncplus
-        run(self.basic_async_task())
+        # Run the task using pyside6-asyncplus; this coroutine already runs on
+        # the GUI thread, so the GUI can be updated directly once it finishes
+        await run(self.basic_async_task())
         
-        # Update GUI after task
-        invoke_in_gui_thread(self, update_gui)
+        self.status_label.setText("Status: Basic task completed!")
+        self.log("GUI updated: Basic task completed!")
     
-    def run_timeout_task(self):
+    async def run_timeout_task(self):
         """Run a task with timeout handling."""
         self.log("=== Running Timeout Task ===")
         self.status_label.setText("Status: Running timeout task...")
         
-        def update_gui():
-            """Update GUI after task completion."""
-            self.status_label.setText("Status: Timeout task completed!")
-            self.log("GUI updated: Timeout task completed!")
-        
         # Run the task with timeout (3 seconds)
-        run_with_timeout(self.timeout_async_task(), 3.0)
-        
-        # Update GUI after task
-        invoke_in_gui_thread(self, update_gui)
+        try:
+            await run_with_timeout(self.timeout_async_task(), 3.0)
+        except TaskTimeoutError as e:
+            self.status_label.setText("Status: Timeout task timed out!")
+            self.log(f"GUI updated: {e}")
+            return
+        
+        self.status_label.setText("Status: Timeout task completed!")
+        self.log("GUI updated: Timeout task completed!")
     
-    def run_retry_task(self):
+    async def run_retry_task(self):
         """Run a task with retry logic."""
         self.log("=== Running Retry Task ===")
         self.status_label.setText("Status: Running retry task...")
         
-        def update_gui():
-            """Update GUI after task completion."""
-            self.status_label.setText("Status: Retry task completed!")
-            self.log("GUI updated: Retry task completed!")
-        
         # Run the task with retry logic (3 retries, 1 second delay)
-        run_with_retry(
-            lambda: self.retry_async_task(),
-            max_retries=3,
-            retry_delay=1.0
-        )
-        
-        # Update GUI after task
-        invoke_in_gui_thread(self, update_gui)
+        try:
+            await run_with_retry(
+                self.retry_async_task,
+                max_retries=3,
+                retry_delay=1.0
+            )
+        except TaskExecutionError as e:
+            self.status_label.setText("Status: Retry task failed!")
+            self.log(f"GUI updated: {e}")
+            return
+        
+        self.status_label.setText("Status: Retry task completed!")
+        self.log("GUI updated: Retry task completed!")
 
 
 def main():
@@ -182,9 +229,9 @@ def main():
     example = BasicExample()
     example.show()
     
-    # Run the application with pyside6-asyncplus
+    # Run the Qt event loop through QtAsyncio so tasks have a running asyncio loop
     with async_app:
-        sys.exit(app.exec())
+        QtAsyncio.run(handle_sigint=True)
 
 
 if __name__ == "__main__":
@@ -19,52 +19,131 @@ Example:
     ...     pyside6_asyncplus.app.runTask(my_coroutine())
 """
 
-from typing import Any, Dict
-
-# Import the main app interface
-from .app import (
-    App,
-    app,
-    run,
-    run_with_timeout,
-    run_with_retry,
-    run_with_progress,
-    invoke_in_gui_thread,
-    is_initialized,
-    get_health_status,
-    get_task_count,
-)
+import functools
+import importlib
+import importlib.util
+import sys
+import warnings
+from types import MappingProxyType, ModuleType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping
 
-# Import core components
-from .nvd.AsyncioPySide6 import AsyncioPySide6, use_asyncio
+# Configuration and exceptions are cheap and imported eagerly
 from .nvd.config import AsyncioPySide6Config, get_config, reset_config, set_config
 from .nvd.exceptions import (
     AsyncioPySide6Error,
     ConfigurationError,
     EventLoopError,
     InitializationError,
-    MemoryError,
+    MemoryLimitExceededError,
     ResourceExhaustedError,
     ShutdownError,
     TaskExecutionError,
     TaskTimeoutError,
     ThreadSafetyError,
 )
-from .nvd.performance import (
-    get_health_status as get_performance_health_status,
-    get_performance_monitor,
-    record_task_completion,
-    record_task_start,
-    start_performance_monitoring,
-    stop_performance_monitoring,
-)
+
+if TYPE_CHECKING:
+    from .app import (
+        App,
+        app,
+        get_health_status,
+        get_task_count,
+        invoke_in_gui_thread,
+        is_initialized,
+        run,
+        run_with_progress,
+        run_with_retry,
+        run_with_timeout,
+    )
+    from .nvd.AsyncioPySide6 import AsyncioPySide6, use_asyncio
+    from .nvd.performance import (
+        HealthStatus,
+        get_health_status as get_performance_health_status,
+        get_performance_monitor,
+        record_task,
+        record_task_completion,
+        record_task_start,
+        start_performance_monitoring,
+        stop_performance_monitoring,
+    )
+
+# The app interface, core library and performance monitoring pull in the Qt
+# bindings and psutil, so they are imported on first access (PEP 562).
+# Maps public name -> (submodule, attribute).
+_LAZY_ATTRS: Dict[str, tuple] = {
+    # Main app interface
+    "App": (".app", "App"),
+    "app": (".app", "app"),
+    "run": (".app", "run"),
+    "run_with_timeout": (".app", "run_with_timeout"),
+    "run_with_retry": (".app", "run_with_retry"),
+    "run_with_progress": (".app", "run_with_progress"),
+    "invoke_in_gui_thread": (".app", "invoke_in_gui_thread"),
+    "is_initialized": (".app", "is_initialized"),
+    "get_health_status": (".app", "get_health_status"),
+    "get_task_count": (".app", "get_task_count"),
+    # Core library
+    "AsyncioPySide6": (".nvd.AsyncioPySide6", "AsyncioPySide6"),
+    "use_asyncio": (".nvd.AsyncioPySide6", "use_asyncio"),
+    # Performance monitoring
+    "HealthStatus": (".nvd.performance", "HealthStatus"),
+    "get_performance_monitor": (".nvd.performance", "get_performance_monitor"),
+    "start_performance_monitoring": (".nvd.performance", "start_performance_monitoring"),
+    "stop_performance_monitoring": (".nvd.performance", "stop_performance_monitoring"),
+    "record_task_start": (".nvd.performance", "record_task_start"),
+    "record_task_completion": (".nvd.performance", "record_task_completion"),
+    "record_task": (".nvd.performance", "record_task"),
+    "get_performance_health_status": (".nvd.performance", "get_health_status"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name on first access."""
+    if name == "MemoryError":
+        warnings.warn(
+            "MemoryError is deprecated, use MemoryLimitExceededError instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return MemoryLimitExceededError
+    try:
+        module_name, _ = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    # Bind every name from the submodule at once
+    module = importlib.import_module(module_name, __name__)
+    namespace = globals()
+    for public, (source, attr) in _LAZY_ATTRS.items():
+        if source == module_name:
+            namespace[public] = getattr(module, attr)
+    return namespace[name]
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(ModuleType):
+    """Module type of this package, keeping ``app`` bound to the App instance"""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing the ``app`` submodule makes the import system set the
+        # package attribute of the same name to the submodule
+        if name == "app" and isinstance(value, ModuleType):
+            value = value.app
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
 
 # Version information
 __version__ = "0.1.0"
 __author__ = "David N. Maina(BigAddict)"
 __description__ = "Native asyncio support for PySide6 with advanced features"
 
-__all__ = [
+__all__ = (
     # Main app interface
     "App",
     "app",
@@ -93,19 +172,21 @@ __all__ = [
     "ResourceExhaustedError",
     "ConfigurationError",
     "TaskExecutionError",
-    "MemoryError",
+    "MemoryLimitExceededError",
     # Performance monitoring
+    "HealthStatus",
     "get_performance_monitor",
     "start_performance_monitoring",
     "stop_performance_monitoring",
     "record_task_start",
     "record_task_completion",
+    "record_task",
     "get_performance_health_status",
     # Version information
     "__version__",
     "__author__",
     "__description__",
-]
+)
 
 
 def get_version() -> str:
@@ -117,93 +198,109 @@ def get_version() -> str:
     return __version__
 
 
-def get_async_backends() -> Dict[str, Any]:
+# Static descriptions, built once; the accessors below return read-only views
+_ASYNC_BACKENDS = MappingProxyType(
+    {
+        # Our enhanced implementation
+        "pyside6_asyncplus": MappingProxyType(
+            {
+                "available": True,
+                "name": "pyside6_asyncplus",
+                "description": "Native asyncio support for PySide6 with advanced features",
+                "features": (
+                    "qtasyncio_integration",
+                    "advanced_task_management",
+                    "timeout_handling",
+                    "retry_logic",
+                    "progress_tracking",
+                    "performance_monitoring",
+                    "health_checks",
+                    "thread_safety",
+                    "gui_thread_safety",
+                    "comprehensive_error_handling",
+                    "configuration_system",
+                    "backward_compatibility",
+                ),
+            }
+        ),
+    }
+)
+
+_RECOMMENDATIONS = MappingProxyType(
+    {
+        "simple_usage": MappingProxyType(
+            {"recommendation": "pyside6_asyncplus", "reason": "Simple async tasks with QtAsyncio integration"}
+        ),
+        "production_usage": MappingProxyType(
+            {
+                "recommendation": "pyside6_asyncplus",
+                "reason": "Production applications need comprehensive error handling and monitoring",
+            }
+        ),
+        "advanced_features": MappingProxyType(
+            {"recommendation": "pyside6_asyncplus", "reason": "Advanced features like timeout, retry, and progress tracking"}
+        ),
+        "gui_applications": MappingProxyType(
+            {"recommendation": "pyside6_asyncplus", "reason": "Seamless integration with Qt GUI applications"}
+        ),
+    }
+)
+
+
+def get_async_backends() -> Mapping[str, Any]:
     """
     Get information about available async backends.
 
     Returns:
-        dict: Dictionary with information about available backends and their capabilities
+        Mapping: Read-only mapping with information about available backends and their capabilities;
+        nested entries are read-only too, so use ``dict(...)`` for a mutable copy
     """
-    backends = {}
-
-    # Our enhanced implementation
-    backends["pyside6_asyncplus"] = {
-        "available": True,
-        "name": "pyside6_asyncplus",
-        "description": "Native asyncio support for PySide6 with advanced features",
-        "features": [
-            "qtasyncio_integration",
-            "advanced_task_management",
-            "timeout_handling",
-            "retry_logic",
-            "progress_tracking",
-            "performance_monitoring",
-            "health_checks",
-            "thread_safety",
-            "gui_thread_safety",
-            "comprehensive_error_handling",
-            "configuration_system",
-            "backward_compatibility",
-        ],
-    }
-
-    return backends
+    return _ASYNC_BACKENDS
 
 
-def recommend_async_approach() -> Dict[str, Any]:
+def recommend_async_approach() -> Mapping[str, Any]:
     """
     Recommend the best async approach based on available backends and requirements.
 
     Returns:
-        dict: Dictionary with recommendations for different use cases
+        Mapping: Read-only mapping with recommendations for different use cases
     """
-    backends = get_async_backends()
-
-    recommendations = {
-        "simple_usage": {"recommendation": "pyside6_asyncplus", "reason": "Simple async tasks with QtAsyncio integration"},
-        "production_usage": {
-            "recommendation": "pyside6_asyncplus",
-            "reason": "Production applications need comprehensive error handling and monitoring",
-        },
-        "advanced_features": {
-            "recommendation": "pyside6_asyncplus",
-            "reason": "Advanced features like timeout, retry, and progress tracking",
-        },
-        "gui_applications": {"recommendation": "pyside6_asyncplus", "reason": "Seamless integration with Qt GUI applications"},
-    }
-
-    return recommendations
+    return _RECOMMENDATIONS
 
 
+@functools.cache
 def is_qtasyncio_available() -> bool:
     """
     Check if QtAsyncio is available in the current PySide6 installation.
 
+    The result is computed once. QtAsyncio is located with find_spec rather
+    than imported, so answering does not load it.
+
     Returns:
         bool: True if QtAsyncio is available, False otherwise
     """
     try:
-        import PySide6.QtAsyncio as QtAsyncio
-
-        return True
+        return importlib.util.find_spec("PySide6.QtAsyncio") is not None
     except ImportError:
+        # PySide6 itself is missing
         return False
 
 
-def get_qtasyncio_info() -> Dict[str, Any]:
+@functools.cache
+def get_qtasyncio_info() -> Mapping[str, Any]:
     """
     Get information about QtAsyncio availability and features.
 
     Returns:
-        dict: Dictionary with QtAsyncio information
+        Mapping: Read-only mapping with QtAsyncio information
     """
     qtasyncio_available = is_qtasyncio_available()
 
-    info = {
-        "available": qtasyncio_available,
-        "name": "PySide6 QtAsyncio",
-        "description": "Built-in async support for PySide6",
-        "features": ["basic_async", "qt_integration", "signal_handling", "debug_mode"] if qtasyncio_available else [],
-    }
-
-    return info
+    return MappingProxyType(
+        {
+            "available": qtasyncio_available,
+            "name": "PySide6 QtAsyncio",
+            "description": "Built-in async support for PySide6",
+            "features": ("basic_async", "qt_integration", "signal_handling", "debug_mode") if qtasyncio_available else (),
+        }
+    )
@@ -15,27 +15,33 @@ class App:
     """Main application class for pyside6_asyncplus."""
     
     def __init__(self):
-        self._asyncio_app = AsyncioPySide6()
+        # The library singleton is created on first entry rather than when the
+        # module-level ``app`` is built at import time
+        self._asyncio_app: Optional[AsyncioPySide6] = None
     
     def __enter__(self):
         """Enter the application context."""
+        if self._asyncio_app is None:
+            self._asyncio_app = AsyncioPySide6()
         self._asyncio_app.__enter__()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit the application context."""
-        self._asyncio_app.__exit__(exc_type, exc_val, exc_tb)
+        # Nothing to exit if the context was never entered
+        if self._asyncio_app is not None:
+            self._asyncio_app.__exit__(exc_type, exc_val, exc_tb)
     
-    @staticmethod
-    def runTask(coro):
-        """Run a basic async task."""
-        return AsyncioPySide6.runTask(coro)
-    
-    @staticmethod
-    def runTaskWithTimeout(coro, timeout: float):
-        """Run task with timeout."""
-        return AsyncioPySide6.runTaskWithTimeout(coro, timeout)
+    # Bound straight to the library's static methods so a call through App
+    # costs no extra Python frame
+    runTask = staticmethod(AsyncioPySide6.runTask)
+    runTaskWithTimeout = staticmethod(AsyncioPySide6.runTaskWithTimeout)
+    invokeInGuiThread = staticmethod(AsyncioPySide6.invokeInGuiThread)
+    is_initialized = staticmethod(AsyncioPySide6.is_initialized)
+    get_health_status = staticmethod(AsyncioPySide6.get_health_status)
+    get_task_count = staticmethod(AsyncioPySide6.get_task_count)
     
+    # These two keep their own defaults, which differ from the library's
     @staticmethod
     def runTaskWithRetry(coro_func: Callable, max_retries: int = 3, retry_delay: float = 1.0):
         """Run task with retry logic."""
@@ -45,70 +51,22 @@ class App:
     def runTaskWithProgress(coro, progress_callback: Optional[Callable] = None):
         """Run task with thread-safe progress tracking."""
         return AsyncioPySide6.runTaskWithProgress(coro, progress_callback)
-    
-    @staticmethod
-    def invokeInGuiThread(gui_object, callable):
-        """Safe GUI thread invocation."""
-        return AsyncioPySide6.invokeInGuiThread(gui_object, callable)
-    
-    @staticmethod
-    def is_initialized():
-        """Check if initialized."""
-        return AsyncioPySide6.is_initialized()
-    
-    @staticmethod
-    def get_health_status():
-        """Get system health status."""
-        return AsyncioPySide6.get_health_status()
-    
-    @staticmethod
-    def get_task_count():
-        """Get active task count."""
-        return AsyncioPySide6.get_task_count()
 
 
 # Create a global instance for convenience
 app = App()
 
 
-def run(coro):
-    """Run a basic async task using the global app instance."""
-    return app.runTask(coro)
-
-
-def run_with_timeout(coro, timeout: float):
-    """Run task with timeout using the global app instance."""
-    return app.runTaskWithTimeout(coro, timeout)
-
-
-def run_with_retry(coro_func: Callable, max_retries: int = 3, retry_delay: float = 1.0):
-    """Run task with retry logic using the global app instance."""
-    return app.runTaskWithRetry(coro_func, max_retries, retry_delay)
-
-
-def run_with_progress(coro, progress_callback: Optional[Callable] = None):
-    """Run task with thread-safe progress tracking using the global app instance."""
-    return app.runTaskWithProgress(coro, progress_callback)
-
-
-def invoke_in_gui_thread(gui_object, callable):
-    """Safe GUI thread invocation using the global app instance."""
-    return app.invokeInGuiThread(gui_object, callable)
-
-
-def is_initialized():
-    """Check if initialized using the global app instance."""
-    return app.is_initialized()
-
-
-def get_health_status():
-    """Get system health status using the global app instance."""
-    return app.get_health_status()
-
-
-def get_task_count():
-    """Get active task count using the global app instance."""
-    return app.get_task_count()
+# Module-level shortcuts; all App methods are static, so these skip the
+# global instance and call the library directly
+run = AsyncioPySide6.runTask
+run_with_timeout = AsyncioPySide6.runTaskWithTimeout
+run_with_retry = App.runTaskWithRetry
+run_with_progress = App.runTaskWithProgress
+invoke_in_gui_thread = AsyncioPySide6.invokeInGuiThread
+is_initialized = AsyncioPySide6.is_initialized
+get_health_status = AsyncioPySide6.get_health_status
+get_task_count = AsyncioPySide6.get_task_count
 
 
 # Export the main classes and functions
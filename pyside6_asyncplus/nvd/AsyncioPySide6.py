@@ -15,13 +15,15 @@ The module extends QtAsyncio with:
 """
 
 import asyncio
+import functools
+import heapq
+import itertools
 import logging
 import threading
 import time
-import uuid
 import warnings
 from contextlib import contextmanager
-from typing import Any, Callable, Coroutine, Dict, Optional, Union
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
 
 try:
     import PySide6.QtAsyncio as QtAsyncio
@@ -38,14 +40,21 @@ from .exceptions import (
     ConfigurationError,
     EventLoopError,
     InitializationError,
-    MemoryError,
+    MemoryLimitExceededError,
     ResourceExhaustedError,
     ShutdownError,
     TaskExecutionError,
     TaskTimeoutError,
     ThreadSafetyError,
 )
-from .performance import get_health_status, record_task_completion, record_task_start
+from .performance import (
+    HealthStatus,
+    get_health_status,
+    get_performance_monitor,
+    record_task,
+    record_task_completion,
+    record_task_start,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +95,8 @@ class AsyncioPySide6:
     _instance: Optional["AsyncioPySide6"] = None
     _lock = threading.Lock()
     _initialized = False
+    # Process-wide task id source; small ints hash and compare cheaply
+    _task_ids = itertools.count(1)
 
     def __new__(cls) -> "AsyncioPySide6":
         """Create or return the singleton instance.
@@ -112,17 +123,38 @@ class AsyncioPySide6:
             raise ConfigurationError("QtAsyncio is not available in this PySide6 installation")
 
         self.config = get_config()
-        self._active_tasks: set[str] = set()
+        self._active_tasks: set[int] = set()
         self._performance_monitoring = False
         self._shutdown_called = False
         self._initialized = False  # Changed from True to False - initialization happens later
 
+        # Deadlines for runTaskWithTimeout, enforced by one shared timer armed
+        # for the earliest deadline rather than a timer handle per task. Kept
+        # across re-runs of __init__ so that pending deadlines are never orphaned.
+        if not hasattr(self, "_task_deadlines"):
+            self._task_deadlines: Dict[int, Tuple[float, asyncio.Task]] = {}
+            # Min-heap of (deadline, task_id); task ids are unique, so they also
+            # break ties. Entries of finished tasks are dropped lazily.
+            self._deadline_heap: List[Tuple[float, int]] = []
+            self._expired_deadlines: set[int] = set()
+            self._deadline_handle: Optional[asyncio.TimerHandle] = None
+            self._deadline_at: Optional[float] = None
+            self._deadline_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def _reset_state(self) -> None:
         """Reset the internal state for testing purposes.
 
         This method is used for testing to ensure a clean state between tests.
         """
         self._active_tasks.clear()
+        self._task_deadlines.clear()
+        self._deadline_heap.clear()
+        self._expired_deadlines.clear()
+        if self._deadline_handle is not None:
+            self._deadline_handle.cancel()
+        self._deadline_handle = None
+        self._deadline_at = None
+        self._deadline_loop = None
         self._performance_monitoring = False
         self._shutdown_called = False
         self._initialized = False  # Reset initialized state for testing
@@ -211,10 +243,11 @@ class AsyncioPySide6:
             if self._performance_monitoring:
                 self._stop_performance_monitoring()
 
-            # Cancel any remaining active tasks
-            for task_id in list(self._active_tasks):
-                logger.debug(f"Cancelling remaining task {task_id}")
-                self._active_tasks.discard(task_id)
+            # Stop tracking any remaining active tasks in one go; they are not
+            # cancelled, and timed tasks keep their deadlines
+            if self._active_tasks:
+                logger.debug(f"Dropping {len(self._active_tasks)} remaining tasks")
+                self._active_tasks.clear()
 
             self._shutdown_called = True
             logger.info("AsyncioPySide6 shutdown completed")
@@ -249,37 +282,108 @@ class AsyncioPySide6:
         except RuntimeError:
             return False
 
-    def _internal_runTask(self, coro: Coroutine[Any, Any, Any]) -> None:
+    def _record_unscheduled(self, task_id: int) -> None:
+        """Record a task that could not be scheduled in one fused start/fail event.
+
+        Args:
+            task_id: The ID of the task that was skipped
+        """
+        now = time.monotonic()
+        record_task(task_id, now, now, False, "No event loop")
+
+    def _register_deadline(self, task_id: int, timeout: float) -> None:
+        """Register a deadline for the current task, arming the shared timer if it is earlier.
+
+        Args:
+            task_id: The ID of the task being timed
+            timeout: Timeout in seconds from now
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self._task_deadlines[task_id] = (deadline, asyncio.current_task())
+        heap = self._deadline_heap
+        # Entries of tasks that finished early are only popped once they reach
+        # the head; rebuild the heap when they dominate it
+        if len(heap) > 2 * len(self._task_deadlines) + 64:
+            heap[:] = [(entry_deadline, entry_id) for entry_id, (entry_deadline, _) in self._task_deadlines.items()]
+            heapq.heapify(heap)
+        else:
+            heapq.heappush(heap, (deadline, task_id))
+        if self._deadline_handle is None or self._deadline_loop is not loop or deadline < self._deadline_at:
+            self._arm_deadline_timer(loop, deadline)
+
+    def _arm_deadline_timer(self, loop: asyncio.AbstractEventLoop, when: float) -> None:
+        """Point the shared deadline timer at loop time ``when``."""
+        if self._deadline_handle is not None and self._deadline_loop is loop:
+            self._deadline_handle.cancel()
+        self._deadline_loop = loop
+        self._deadline_at = when
+        self._deadline_handle = loop.call_at(when, self._sweep_deadlines)
+
+    def _sweep_deadlines(self) -> None:
+        """Cancel every task whose deadline has passed, then re-arm for the next one."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._deadline_loop:
+            # Superseded by a timer armed on a newer loop
+            return
+
+        now = loop.time()
+        heap = self._deadline_heap
+        deadlines = self._task_deadlines
+        while heap:
+            deadline, task_id = heap[0]
+            entry = deadlines.get(task_id)
+            if entry is not None and deadline > now:
+                break
+            heapq.heappop(heap)
+            if entry is None:
+                continue  # Finished before its deadline
+            del deadlines[task_id]
+            task = entry[1]
+            if task.get_loop() is loop:
+                self._expired_deadlines.add(task_id)
+                task.cancel()
+
+        self._deadline_handle = None
+        self._deadline_at = None
+        if heap:
+            self._arm_deadline_timer(loop, heap[0][0])
+
+    def _internal_runTask(self, coro: Coroutine[Any, Any, Any]) -> Optional["asyncio.Future[Any]"]:
         """Run an asynchronous task using QtAsyncio.
 
         Args:
             coro: The coroutine to execute
 
+        Returns:
+            Optional[asyncio.Future]: The scheduled task, or None if no event loop is running
+
         Raises:
             EventLoopError: If task execution fails
         """
         try:
-            task_id = str(uuid.uuid4())
-            record_task_start(task_id)
-            self._active_tasks.add(task_id)
+            task_id = next(AsyncioPySide6._task_ids)
 
             # Check if there's an active event loop
             if not self._has_event_loop():
                 logger.warning(f"No active event loop found for task {task_id}, skipping execution")
-                record_task_completion(task_id, False, "No event loop")
-                self._active_tasks.discard(task_id)
-                return
+                self._record_unscheduled(task_id)
+                return None
+
+            record_task_start(task_id)
+            self._active_tasks.add(task_id)
 
             # Use asyncio.ensure_future for task scheduling
             future = asyncio.ensure_future(coro)
             future.add_done_callback(lambda f: self._handle_task_completion(task_id, f))
 
             logger.debug(f"Scheduled task {task_id}")
+            return future
         except Exception as e:
             logging.error(f"Failed to run task: {e}")
             raise EventLoopError(f"Failed to run task: {e}")
 
-    def _handle_task_completion(self, task_id: str, future: Any) -> None:
+    def _handle_task_completion(self, task_id: int, future: Any) -> None:
         """Handle task completion and any exceptions.
 
         Args:
@@ -361,20 +465,23 @@ class AsyncioPySide6:
         return instance._internal_shutdown()
 
     @staticmethod
-    def runTask(coro: Coroutine[Any, Any, Any]) -> None:
+    def runTask(coro: Coroutine[Any, Any, Any]) -> Optional["asyncio.Future[Any]"]:
         """Run an asynchronous task.
 
         Args:
             coro: Asynchronous coroutine to be executed
 
+        Returns:
+            Optional[asyncio.Future]: The scheduled task, or None if no event loop is running
+
         Raises:
             EventLoopError: If the event loop is not available or task execution fails
         """
         instance = AsyncioPySide6()
-        instance._internal_runTask(coro)
+        return instance._internal_runTask(coro)
 
     @staticmethod
-    def create_and_run_task(coro_func: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+    def create_and_run_task(coro_func: Callable[[], Coroutine[Any, Any, Any]]) -> Optional["asyncio.Future[Any]"]:
         """Create and run an asynchronous task.
 
         This method helps prevent RuntimeWarnings by ensuring the coroutine is created
@@ -383,15 +490,18 @@ class AsyncioPySide6:
         Args:
             coro_func: Function that returns an asynchronous coroutine to be executed
 
+        Returns:
+            Optional[asyncio.Future]: The scheduled task, or None if no event loop is running
+
         Raises:
             EventLoopError: If the event loop is not available or task execution fails
         """
         instance = AsyncioPySide6()
         coro = coro_func()
-        instance._internal_runTask(coro)
+        return instance._internal_runTask(coro)
 
     @staticmethod
-    def run_task_safely(coro_func: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+    def run_task_safely(coro_func: Callable[[], Coroutine[Any, Any, Any]]) -> Optional["asyncio.Future[Any]"]:
         """Run an asynchronous task safely, preventing RuntimeWarnings.
 
         This is the recommended method for running tasks.
@@ -399,19 +509,22 @@ class AsyncioPySide6:
         Args:
             coro_func: Function that returns an asynchronous coroutine to be executed
 
+        Returns:
+            Optional[asyncio.Future]: The scheduled task, or None if no event loop is running
+
         Raises:
             EventLoopError: If the event loop is not available or task execution fails
         """
         try:
             instance = AsyncioPySide6()
             coro = coro_func()
-            instance._internal_runTask(coro)
+            return instance._internal_runTask(coro)
         except Exception as e:
             logging.error(f"Failed to run task safely: {e}")
             raise EventLoopError(f"Failed to run task safely: {e}")
 
     @staticmethod
-    def run_task_without_warnings(coro_func: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+    def run_task_without_warnings(coro_func: Callable[[], Coroutine[Any, Any, Any]]) -> Optional["asyncio.Future[Any]"]:
         """Run an asynchronous task without RuntimeWarnings.
 
         This method suppresses coroutine warnings for testing purposes.
@@ -419,6 +532,9 @@ class AsyncioPySide6:
         Args:
             coro_func: Function that returns an asynchronous coroutine to be executed
 
+        Returns:
+            Optional[asyncio.Future]: The scheduled task, or None if no event loop is running
+
         Raises:
             EventLoopError: If the event loop is not available or task execution fails
         """
@@ -427,7 +543,7 @@ class AsyncioPySide6:
             try:
                 instance = AsyncioPySide6()
                 coro = coro_func()
-                instance._internal_runTask(coro)
+                return instance._internal_runTask(coro)
             except Exception as e:
                 logging.error(f"Failed to run task without warnings: {e}")
                 raise EventLoopError(f"Failed to run task without warnings: {e}")
@@ -478,15 +594,21 @@ class AsyncioPySide6:
         AsyncioPySide6._initialized = False  # Reset class-level flag
         instance = AsyncioPySide6()
         instance._reset_state()
+        get_performance_monitor().reset()
 
     @staticmethod
-    def runTaskWithTimeout(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> None:
+    def runTaskWithTimeout(
+        coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None
+    ) -> Optional["asyncio.Future[Any]"]:
         """Run an asynchronous task with timeout.
 
         Args:
             coro: Asynchronous coroutine to be executed
             timeout: Timeout in seconds. If None, uses default from config
 
+        Returns:
+            Optional[asyncio.Future]: The scheduled task, or None if no event loop is running
+
         Raises:
             TaskTimeoutError: If the task exceeds the timeout
             EventLoopError: If the event loop is not available or task execution fails
@@ -496,35 +618,46 @@ class AsyncioPySide6:
         if timeout is None:
             timeout = config.task_timeout
 
-        task_id = str(uuid.uuid4())
-        record_task_start(task_id)
-        instance._active_tasks.add(task_id)
+        task_id = next(AsyncioPySide6._task_ids)
 
         async def timeout_wrapper() -> Any:
+            # The shared deadline sweeper cancels this task in place once the
+            # deadline passes; finishing early just drops the dict entry, so
+            # no per-task timer handle is created or cancelled.
+            instance._register_deadline(task_id, timeout)
             try:
-                result = await asyncio.wait_for(coro, timeout=timeout)
+                result = await coro
                 record_task_completion(task_id, True)
                 instance._active_tasks.discard(task_id)
                 return result
-            except asyncio.TimeoutError:
+            except asyncio.CancelledError:
+                if task_id not in instance._expired_deadlines:
+                    raise
+                asyncio.current_task().uncancel()
                 record_task_completion(task_id, False, "Timeout")
                 instance._active_tasks.discard(task_id)
-                raise TaskTimeoutError(f"Task exceeded timeout of {timeout} seconds")
+                raise TaskTimeoutError(f"Task exceeded timeout of {timeout} seconds") from None
             except Exception as e:
                 record_task_completion(task_id, False, str(e))
                 instance._active_tasks.discard(task_id)
                 raise
+            finally:
+                instance._task_deadlines.pop(task_id, None)
+                instance._expired_deadlines.discard(task_id)
 
         try:
             # Check if there's an active event loop
             if not instance._has_event_loop():
                 logger.warning(f"No active event loop found for timeout task {task_id}, skipping execution")
-                record_task_completion(task_id, False, "No event loop")
-                instance._active_tasks.discard(task_id)
-                return
+                instance._record_unscheduled(task_id)
+                return None
+
+            record_task_start(task_id)
+            instance._active_tasks.add(task_id)
 
-            asyncio.ensure_future(timeout_wrapper())
+            future = asyncio.ensure_future(timeout_wrapper())
             logger.debug(f"Scheduled timeout task {task_id} with {timeout}s timeout")
+            return future
         except Exception as e:
             record_task_completion(task_id, False, str(e))
             instance._active_tasks.discard(task_id)
@@ -536,7 +669,7 @@ class AsyncioPySide6:
         coro_func: Callable[[], Coroutine[Any, Any, Any]],
         max_retries: Optional[int] = None,
         retry_delay: Optional[float] = None,
-    ) -> None:
+    ) -> Optional["asyncio.Future[Any]"]:
         """Run an asynchronous task with retry logic.
 
         Args:
@@ -544,6 +677,9 @@ class AsyncioPySide6:
             max_retries: Maximum number of retry attempts. If None, uses default from config
             retry_delay: Delay between retries in seconds. If None, uses default from config
 
+        Returns:
+            Optional[asyncio.Future]: The scheduled task, or None if no event loop is running
+
         Raises:
             TaskExecutionError: If all retry attempts fail
             EventLoopError: If the event loop is not available or task execution fails
@@ -555,9 +691,7 @@ class AsyncioPySide6:
         if retry_delay is None:
             retry_delay = config.retry_delay
 
-        task_id = str(uuid.uuid4())
-        record_task_start(task_id)
-        instance._active_tasks.add(task_id)
+        task_id = next(AsyncioPySide6._task_ids)
 
         async def retry_wrapper() -> Any:
             last_exception = None
@@ -582,12 +716,15 @@ class AsyncioPySide6:
             # Check if there's an active event loop
             if not instance._has_event_loop():
                 logger.warning(f"No active event loop found for retry task {task_id}, skipping execution")
-                record_task_completion(task_id, False, "No event loop")
-                instance._active_tasks.discard(task_id)
-                return
+                instance._record_unscheduled(task_id)
+                return None
 
-            asyncio.ensure_future(retry_wrapper())
+            record_task_start(task_id)
+            instance._active_tasks.add(task_id)
+
+            future = asyncio.ensure_future(retry_wrapper())
             logger.debug(f"Scheduled retry task {task_id} with {max_retries} retries")
+            return future
         except Exception as e:
             record_task_completion(task_id, False, str(e))
             instance._active_tasks.discard(task_id)
@@ -595,29 +732,31 @@ class AsyncioPySide6:
             raise EventLoopError(f"Failed to schedule retry task: {e}")
 
     @staticmethod
-    def runTaskWithProgress(coro: Coroutine[Any, Any, Any], progress_callback: Callable[[float], None]) -> None:
+    def runTaskWithProgress(
+        coro: Coroutine[Any, Any, Any], progress_callback: Callable[[float], None]
+    ) -> Optional["asyncio.Future[Any]"]:
         """Run an asynchronous task with progress reporting.
 
         Args:
             coro: Asynchronous coroutine to be executed
             progress_callback: Callback function for progress updates (0.0 to 1.0)
 
+        Returns:
+            Optional[asyncio.Future]: The scheduled task, or None if no event loop is running
+
         Raises:
             EventLoopError: If the event loop is not available or task execution fails
         """
         instance = AsyncioPySide6()
-        task_id = str(uuid.uuid4())
-        record_task_start(task_id)
-        instance._active_tasks.add(task_id)
+        task_id = next(AsyncioPySide6._task_ids)
 
         # Create a thread-safe progress callback
         def safe_progress_callback(progress: float) -> None:
             """Thread-safe progress callback that ensures GUI thread execution."""
             try:
-                # Use QTimer to ensure GUI thread execution
-                from PySide6.QtCore import QTimer
-
-                QTimer.singleShot(0, lambda: progress_callback(progress))
+                # Use QTimer to ensure GUI thread execution; bind the value
+                # with partial rather than a per-call closure
+                QTimer.singleShot(0, functools.partial(progress_callback, progress))
             except Exception as e:
                 logger.warning(f"Progress callback failed: {e}")
 
@@ -645,12 +784,15 @@ class AsyncioPySide6:
             # Check if there's an active event loop
             if not instance._has_event_loop():
                 logger.warning(f"No active event loop found for progress task {task_id}, skipping execution")
-                record_task_completion(task_id, False, "No event loop")
-                instance._active_tasks.discard(task_id)
-                return
+                instance._record_unscheduled(task_id)
+                return None
+
+            record_task_start(task_id)
+            instance._active_tasks.add(task_id)
 
-            asyncio.ensure_future(progress_wrapper())
+            future = asyncio.ensure_future(progress_wrapper())
             logger.debug(f"Scheduled progress task {task_id}")
+            return future
         except Exception as e:
             record_task_completion(task_id, False, str(e))
             instance._active_tasks.discard(task_id)
@@ -658,11 +800,11 @@ class AsyncioPySide6:
             raise EventLoopError(f"Failed to schedule progress task: {e}")
 
     @staticmethod
-    def get_health_status() -> Dict[str, Any]:
+    def get_health_status() -> HealthStatus:
         """Get the current health status of the system.
 
         Returns:
-            dict: Dictionary containing health status information
+            HealthStatus: Dictionary containing health status information
         """
         instance = AsyncioPySide6()
         health = get_health_status()
@@ -7,17 +7,79 @@ allowing users to customize various aspects of the library's behavior.
 
 import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, fields
 from typing import Optional
 
 
-@dataclass
+_LEVELS = {name: getattr(logging, name) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}
+
+# Root handler installed by _setup_logging when no logging was configured
+_log_handler: Optional[logging.Handler] = None
+# Format string last applied to _log_handler
+_log_format: Optional[str] = None
+
+# Numeric settings checked by _validate_config
+_POSITIVE = (
+    "event_loop_interval",
+    "idle_sleep_time",
+    "initialization_timeout",
+    "shutdown_timeout",
+    "task_timeout",
+    "max_concurrent_tasks",
+    "task_queue_size",
+    "metrics_history_size",
+    "loop_lag_interval",
+    "loop_lag_threshold_ms",
+)
+_NON_NEGATIVE = ("max_retries", "retry_delay", "health_cache_ttl")
+
+
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on", "t"})
+
+
+def _to_bool(value: str) -> bool:
+    """Parse a boolean environment variable (true/1/yes/on/t in any case is True)"""
+    return value.strip().casefold() in _BOOL_TRUE
+
+
+# (environment variable, config attribute, converter) for from_environment
+_ENV_SPEC = (
+    # Event loop configuration
+    ("ASYNCIOPYSIDE6_EVENT_LOOP_INTERVAL", "event_loop_interval", float),
+    ("ASYNCIOPYSIDE6_IDLE_SLEEP_TIME", "idle_sleep_time", float),
+    ("ASYNCIOPYSIDE6_USE_DEDICATED_THREAD", "use_dedicated_thread", _to_bool),
+    # Timeout configuration
+    ("ASYNCIOPYSIDE6_INIT_TIMEOUT", "initialization_timeout", float),
+    ("ASYNCIOPYSIDE6_SHUTDOWN_TIMEOUT", "shutdown_timeout", float),
+    ("ASYNCIOPYSIDE6_TASK_TIMEOUT", "task_timeout", float),
+    # Retry configuration
+    ("ASYNCIOPYSIDE6_MAX_RETRIES", "max_retries", int),
+    ("ASYNCIOPYSIDE6_RETRY_DELAY", "retry_delay", float),
+    # Logging configuration
+    ("ASYNCIOPYSIDE6_ENABLE_LOGGING", "enable_logging", _to_bool),
+    ("ASYNCIOPYSIDE6_LOG_LEVEL", "log_level", str.upper),
+    # Performance configuration
+    ("ASYNCIOPYSIDE6_MAX_CONCURRENT_TASKS", "max_concurrent_tasks", int),
+    ("ASYNCIOPYSIDE6_TASK_QUEUE_SIZE", "task_queue_size", int),
+    # Debug configuration
+    ("ASYNCIOPYSIDE6_ENABLE_DEBUG_MODE", "enable_debug_mode", _to_bool),
+    ("ASYNCIOPYSIDE6_ENABLE_PERFORMANCE_MONITORING", "enable_performance_monitoring", _to_bool),
+    # Performance monitoring configuration
+    ("ASYNCIOPYSIDE6_METRICS_HISTORY_SIZE", "metrics_history_size", int),
+    ("ASYNCIOPYSIDE6_LOOP_LAG_INTERVAL", "loop_lag_interval", float),
+    ("ASYNCIOPYSIDE6_LOOP_LAG_THRESHOLD_MS", "loop_lag_threshold_ms", float),
+    ("ASYNCIOPYSIDE6_HEALTH_CACHE_TTL", "health_cache_ttl", float),
+)
+
+
+@dataclass(slots=True)
 class AsyncioPySide6Config:
     """
     Configuration class for AsyncioPySide6.
 
     This class holds all configurable parameters for the library.
     Values can be set programmatically or through environment variables.
+    Instances use slots: only the declared fields can be assigned.
     """
 
     # Event loop configuration
@@ -50,6 +112,10 @@ class AsyncioPySide6Config:
     # Performance monitoring configuration
     enable_metrics_collection: bool = True
     metrics_interval: float = 5.0  # Metrics collection interval in seconds
+    metrics_history_size: int = 1000  # Samples retained in the metrics history ring buffer
+    loop_lag_interval: float = 0.1  # Event loop lag sampling interval in seconds
+    loop_lag_threshold_ms: float = 100.0  # p95 loop lag above which health is "degraded"
+    health_cache_ttl: float = 0.5  # Seconds a health status may be reused; 0 disables the cache
     enable_memory_monitoring: bool = True
     memory_warning_threshold: float = 0.8  # 80% memory usage warning
     enable_task_monitoring: bool = True
@@ -64,41 +130,42 @@ class AsyncioPySide6Config:
     def __post_init__(self) -> None:
         """Validate configuration after initialization"""
         self._validate_config()
-        self._setup_logging()
 
     def _validate_config(self) -> None:
         """Validate configuration parameters"""
-        if self.event_loop_interval <= 0:
-            raise ValueError("event_loop_interval must be positive")
-
-        if self.idle_sleep_time <= 0:
-            raise ValueError("idle_sleep_time must be positive")
-
-        if self.initialization_timeout <= 0:
-            raise ValueError("initialization_timeout must be positive")
-
-        if self.shutdown_timeout <= 0:
-            raise ValueError("shutdown_timeout must be positive")
-
-        if self.task_timeout <= 0:
-            raise ValueError("task_timeout must be positive")
-
-        if self.max_retries < 0:
-            raise ValueError("max_retries must be non-negative")
-
-        if self.retry_delay < 0:
-            raise ValueError("retry_delay must be non-negative")
+        for name in _POSITIVE:
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
 
-        if self.max_concurrent_tasks <= 0:
-            raise ValueError("max_concurrent_tasks must be positive")
-
-        if self.task_queue_size <= 0:
-            raise ValueError("task_queue_size must be positive")
+        for name in _NON_NEGATIVE:
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be non-negative")
 
     def _setup_logging(self) -> None:
-        """Setup logging configuration"""
-        if self.enable_logging:
-            logging.basicConfig(level=getattr(logging, self.log_level.upper()), format=self.log_format)
+        """Setup logging configuration
+
+        Only called for the active configuration (see set_config), so building
+        a config never touches process-wide logging by itself.
+        """
+        global _log_handler, _log_format
+        if not self.enable_logging:
+            return
+
+        root = logging.getLogger()
+        if _log_handler is None or _log_handler not in root.handlers:
+            if root.handlers:
+                # Logging was configured elsewhere; leave it alone like basicConfig would
+                return
+            _log_handler = logging.StreamHandler()
+            _log_format = None
+            root.addHandler(_log_handler)
+        # Our own handler is reconfigured by every new config, unlike basicConfig
+        # which ignores all calls after the first; the formatter is only
+        # rebuilt when the format actually changed
+        if _log_format != self.log_format:
+            _log_handler.setFormatter(logging.Formatter(self.log_format))
+            _log_format = self.log_format
+        root.setLevel(_LEVELS.get(self.log_level.upper(), logging.INFO))
 
     @classmethod
     def from_environment(cls) -> "AsyncioPySide6Config":
@@ -108,108 +175,42 @@ class AsyncioPySide6Config:
         Environment variables:
         - ASYNCIOPYSIDE6_EVENT_LOOP_INTERVAL: Event loop interval in seconds
         - ASYNCIOPYSIDE6_IDLE_SLEEP_TIME: Idle sleep time in seconds
-        - ASYNCIOPYSIDE6_USE_DEDICATED_THREAD: Use dedicated thread (true/false)
+        - ASYNCIOPYSIDE6_USE_DEDICATED_THREAD: Use dedicated thread (true/false, 1/0, yes/no, on/off)
         - ASYNCIOPYSIDE6_INIT_TIMEOUT: Initialization timeout in seconds
         - ASYNCIOPYSIDE6_SHUTDOWN_TIMEOUT: Shutdown timeout in seconds
         - ASYNCIOPYSIDE6_TASK_TIMEOUT: Task timeout in seconds
         - ASYNCIOPYSIDE6_MAX_RETRIES: Maximum retry attempts
         - ASYNCIOPYSIDE6_RETRY_DELAY: Retry delay in seconds
-        - ASYNCIOPYSIDE6_ENABLE_LOGGING: Enable logging (true/false)
+        - ASYNCIOPYSIDE6_ENABLE_LOGGING: Enable logging (true/false, 1/0, yes/no, on/off)
         - ASYNCIOPYSIDE6_LOG_LEVEL: Log level (DEBUG, INFO, WARNING, ERROR)
         - ASYNCIOPYSIDE6_MAX_CONCURRENT_TASKS: Maximum concurrent tasks
         - ASYNCIOPYSIDE6_TASK_QUEUE_SIZE: Task queue size
-        - ASYNCIOPYSIDE6_ENABLE_DEBUG_MODE: Enable debug mode (true/false)
-        - ASYNCIOPYSIDE6_ENABLE_PERFORMANCE_MONITORING: Enable performance monitoring (true/false)
+        - ASYNCIOPYSIDE6_ENABLE_DEBUG_MODE: Enable debug mode (true/false, 1/0, yes/no, on/off)
+        - ASYNCIOPYSIDE6_ENABLE_PERFORMANCE_MONITORING: Enable performance monitoring (true/false, 1/0, yes/no, on/off)
+        - ASYNCIOPYSIDE6_METRICS_HISTORY_SIZE: Number of metrics samples to retain
+        - ASYNCIOPYSIDE6_LOOP_LAG_INTERVAL: Event loop lag sampling interval in seconds
+        - ASYNCIOPYSIDE6_LOOP_LAG_THRESHOLD_MS: Loop lag p95 threshold in milliseconds
+        - ASYNCIOPYSIDE6_HEALTH_CACHE_TTL: Seconds a health status may be reused (0 disables)
         """
-        config = cls()
-
-        # Event loop configuration
-        env_value = os.getenv("ASYNCIOPYSIDE6_EVENT_LOOP_INTERVAL")
-        if env_value is not None:
-            config.event_loop_interval = float(env_value)
-
-        env_value = os.getenv("ASYNCIOPYSIDE6_IDLE_SLEEP_TIME")
-        if env_value is not None:
-            config.idle_sleep_time = float(env_value)
-
-        env_value = os.getenv("ASYNCIOPYSIDE6_USE_DEDICATED_THREAD")
-        if env_value is not None:
-            config.use_dedicated_thread = env_value.lower() == "true"
-
-        # Timeout configuration
-        env_value = os.getenv("ASYNCIOPYSIDE6_INIT_TIMEOUT")
-        if env_value is not None:
-            config.initialization_timeout = float(env_value)
-
-        env_value = os.getenv("ASYNCIOPYSIDE6_SHUTDOWN_TIMEOUT")
-        if env_value is not None:
-            config.shutdown_timeout = float(env_value)
-
-        env_value = os.getenv("ASYNCIOPYSIDE6_TASK_TIMEOUT")
-        if env_value is not None:
-            config.task_timeout = float(env_value)
-
-        # Retry configuration
-        env_value = os.getenv("ASYNCIOPYSIDE6_MAX_RETRIES")
-        if env_value is not None:
-            config.max_retries = int(env_value)
-
-        env_value = os.getenv("ASYNCIOPYSIDE6_RETRY_DELAY")
-        if env_value is not None:
-            config.retry_delay = float(env_value)
-
-        # Logging configuration
-        env_value = os.getenv("ASYNCIOPYSIDE6_ENABLE_LOGGING")
-        if env_value is not None:
-            config.enable_logging = env_value.lower() == "true"
-
-        env_value = os.getenv("ASYNCIOPYSIDE6_LOG_LEVEL")
-        if env_value is not None:
-            config.log_level = env_value.upper()
-
-        # Performance configuration
-        env_value = os.getenv("ASYNCIOPYSIDE6_MAX_CONCURRENT_TASKS")
-        if env_value is not None:
-            config.max_concurrent_tasks = int(env_value)
-
-        env_value = os.getenv("ASYNCIOPYSIDE6_TASK_QUEUE_SIZE")
-        if env_value is not None:
-            config.task_queue_size = int(env_value)
-
-        # Debug configuration
-        env_value = os.getenv("ASYNCIOPYSIDE6_ENABLE_DEBUG_MODE")
-        if env_value is not None:
-            config.enable_debug_mode = env_value.lower() == "true"
-
-        env_value = os.getenv("ASYNCIOPYSIDE6_ENABLE_PERFORMANCE_MONITORING")
-        if env_value is not None:
-            config.enable_performance_monitoring = env_value.lower() == "true"
-
-        return config
+        # Collect overrides first so the instance is built, and validated, once
+        env = os.environ
+        overrides = {}
+        for key, attr, convert in _ENV_SPEC:
+            if (value := env.get(key)) is not None:
+                overrides[attr] = convert(value)
+        return cls(**overrides)
 
     def to_dict(self) -> dict:
         """Convert configuration to dictionary"""
-        return {
-            "event_loop_interval": self.event_loop_interval,
-            "idle_sleep_time": self.idle_sleep_time,
-            "use_dedicated_thread": self.use_dedicated_thread,
-            "initialization_timeout": self.initialization_timeout,
-            "shutdown_timeout": self.shutdown_timeout,
-            "task_timeout": self.task_timeout,
-            "max_retries": self.max_retries,
-            "retry_delay": self.retry_delay,
-            "enable_logging": self.enable_logging,
-            "log_level": self.log_level,
-            "log_format": self.log_format,
-            "max_concurrent_tasks": self.max_concurrent_tasks,
-            "task_queue_size": self.task_queue_size,
-            "enable_debug_mode": self.enable_debug_mode,
-            "enable_performance_monitoring": self.enable_performance_monitoring,
-        }
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
 
     def __str__(self) -> str:
         """String representation of configuration"""
-        return f"AsyncioPySide6Config({', '.join(f'{k}={v}' for k, v in self.to_dict().items())})"
+        return f"AsyncioPySide6Config({', '.join(f'{name}={getattr(self, name)}' for name in _FIELD_NAMES)})"
+
+
+# Field names resolved once; to_dict and __str__ iterate them so new fields are never missed
+_FIELD_NAMES = tuple(f.name for f in fields(AsyncioPySide6Config))
 
 
 # Global configuration instance
@@ -218,9 +219,15 @@ _config: Optional[AsyncioPySide6Config] = None
 
 def get_config() -> AsyncioPySide6Config:
     """Get the global configuration instance"""
+    # Config instances are always truthy, so the steady state is one global load
+    return _config or _load_config()
+
+
+def _load_config() -> AsyncioPySide6Config:
+    """Create the global configuration from the environment on first use"""
     global _config
-    if _config is None:
-        _config = AsyncioPySide6Config.from_environment()
+    _config = AsyncioPySide6Config.from_environment()
+    _config._setup_logging()
     return _config
 
 
@@ -228,6 +235,7 @@ def set_config(config: AsyncioPySide6Config) -> None:
     """Set the global configuration instance"""
     global _config
     _config = config
+    config._setup_logging()
 
 
 def reset_config() -> None:
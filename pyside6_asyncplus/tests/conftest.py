@@ -0,0 +1,24 @@
+"""
+Shared fixtures for the AsyncioPySide6 test suite.
+"""
+
+import copy
+from typing import Iterator
+
+import pytest
+
+from AsyncioPySide6 import AsyncioPySide6, AsyncioPySide6Config
+from AsyncioPySide6.nvd import config as config_module
+
+# Built and validated once; each test starts from a copy rather than a
+# fresh environment read (tests that set variables call reset_config)
+_DEFAULT_CONFIG = AsyncioPySide6Config.from_environment()
+
+
+@pytest.fixture(autouse=True)
+def _reset_library_state() -> Iterator[None]:
+    """Start every test from the default configuration and a fresh singleton."""
+    config_module._config = copy.copy(_DEFAULT_CONFIG)
+    AsyncioPySide6.reset_for_testing()
+    yield
+    AsyncioPySide6.reset_for_testing()
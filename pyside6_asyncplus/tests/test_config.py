@@ -0,0 +1,144 @@
+"""
+Configuration tests for AsyncioPySide6.
+
+These tests exercise only the configuration API, so they can run on their
+own worker alongside the Qt-bound suites; every test class is pinned to an
+xdist group so its tests share one worker process:
+
+    python -m pytest -n auto --dist loadgroup pyside6_asyncplus/tests
+"""
+
+import logging
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, "..")
+
+from AsyncioPySide6 import AsyncioPySide6Config, get_config, reset_config, set_config
+from AsyncioPySide6.nvd import config as config_module
+
+pytestmark = pytest.mark.xdist_group("config")
+
+
+class TestAsyncioPySide6Configuration:
+    """Test configuration functionality."""
+
+    def test_default_configuration(self) -> None:
+        """Test default configuration values."""
+        config = get_config()
+
+        assert config.task_timeout == 30.0
+        assert config.max_retries == 3
+        assert config.retry_delay == 0.1
+        assert config.enable_logging == True
+        assert config.log_level == "INFO"
+
+    def test_configuration_modification(self) -> None:
+        """Test modifying configuration."""
+        config = get_config()
+
+        # Modify configuration
+        config.task_timeout = 60.0
+        config.max_retries = 5
+        config.enable_debug_mode = True
+
+        set_config(config)
+
+        # Verify changes
+        new_config = get_config()
+        assert new_config.task_timeout == 60.0
+        assert new_config.max_retries == 5
+        assert new_config.enable_debug_mode == True
+
+    def test_configuration_reset(self) -> None:
+        """Test resetting configuration to defaults."""
+        config = get_config()
+        config.task_timeout = 999.0
+        set_config(config)
+
+        # Reset to defaults
+        reset_config()
+
+        # Verify reset
+        config = get_config()
+        assert config.task_timeout == 30.0
+
+    def test_configuration_validation(self) -> None:
+        """Test configuration validation."""
+        config = get_config()
+
+        # Test valid values
+        config.task_timeout = 10.0
+        config.max_retries = 2
+        config.retry_delay = 0.5
+
+        # Should not raise exception
+        config._validate_config()
+
+        # Test invalid values
+        with pytest.raises(ValueError):
+            config.task_timeout = -1.0
+            config._validate_config()
+
+        with pytest.raises(ValueError):
+            config.max_retries = -1
+            config._validate_config()
+
+    def test_configuration_to_dict(self) -> None:
+        """Test to_dict covers every configuration field."""
+        config = get_config()
+        config_dict = config.to_dict()
+
+        assert config_dict["task_timeout"] == 30.0
+        assert config_dict["loop_lag_threshold_ms"] == config.loop_lag_threshold_ms
+        assert set(config_dict) == set(config.__slots__)
+
+    def test_only_active_configuration_sets_up_logging(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that building a config leaves root logging alone until it is set."""
+        root = logging.getLogger()
+        level = root.level
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(config_module, "_log_handler", None)
+        monkeypatch.setattr(config_module, "_log_format", None)
+        root.setLevel(logging.WARNING)
+        try:
+            config = AsyncioPySide6Config(log_level="DEBUG")
+            assert root.level == logging.WARNING
+            assert root.handlers == []
+
+            set_config(config)
+            assert root.level == logging.DEBUG
+            assert root.handlers == [config_module._log_handler]
+        finally:
+            root.setLevel(level)
+
+    def test_configuration_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test environment overrides are converted and validated."""
+        monkeypatch.setenv("ASYNCIOPYSIDE6_TASK_TIMEOUT", "12.5")
+        monkeypatch.setenv("ASYNCIOPYSIDE6_MAX_RETRIES", "7")
+        monkeypatch.setenv("ASYNCIOPYSIDE6_ENABLE_DEBUG_MODE", "TRUE")
+        monkeypatch.setenv("ASYNCIOPYSIDE6_LOG_LEVEL", "debug")
+        monkeypatch.setenv("ASYNCIOPYSIDE6_ENABLE_LOGGING", "0")
+        monkeypatch.setenv("ASYNCIOPYSIDE6_USE_DEDICATED_THREAD", "yes")
+
+        # Drop any config loaded before the overrides were set
+        reset_config()
+        config = get_config()
+        assert config.task_timeout == 12.5
+        assert config.max_retries == 7
+        assert config.enable_debug_mode == True
+        assert config.log_level == "DEBUG"
+        assert config.enable_logging == False
+        assert config.use_dedicated_thread == True
+
+        # Invalid overrides are rejected rather than silently accepted
+        reset_config()
+        monkeypatch.setenv("ASYNCIOPYSIDE6_TASK_TIMEOUT", "-1")
+        with pytest.raises(ValueError):
+            get_config()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
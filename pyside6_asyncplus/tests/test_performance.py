@@ -6,18 +6,24 @@ functionality in the refactored AsyncioPySide6 implementation.
 """
 
 import asyncio
+import os
 import sys
 import time
-from typing import Any
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
+import psutil
 import pytest
 
 # Add parent directory to path for imports
 sys.path.insert(0, "..")
 
-from AsyncioPySide6 import AsyncioPySide6, get_config, reset_config, set_config
+from AsyncioPySide6 import AsyncioPySide6, get_config, set_config
 from AsyncioPySide6.nvd.performance import (
+    CircuitBreaker,
+    PerformanceMetrics,
+    PerformanceMonitor,
+    TaskMetrics,
     get_health_status,
     get_performance_monitor,
     record_task_completion,
@@ -27,18 +33,39 @@ from AsyncioPySide6.nvd.performance import (
 )
 
 
-class TestPerformanceMonitoring:
-    """Test performance monitoring functionality."""
+async def _noop_task(delay: float = 0.1, result: str = "Task completed") -> str:
+    """Shared coroutine for tests that only need a task to run to completion."""
+    await asyncio.sleep(delay)
+    return result
+
+
+@pytest.fixture
+def psutil_stub(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Stand-in psutil: 100MB RSS, 25% CPU, 8GB RAM; counts handle and RAM lookups."""
+    process = SimpleNamespace(
+        memory_info=lambda: SimpleNamespace(rss=100 * 1024 * 1024),
+        cpu_percent=lambda interval=None: 25.0,
+    )
+    calls = {"Process": 0, "virtual_memory": 0}
+
+    def make_process() -> SimpleNamespace:
+        calls["Process"] += 1
+        return process
+
+    def virtual_memory() -> SimpleNamespace:
+        calls["virtual_memory"] += 1
+        return SimpleNamespace(total=8 * 1024**3)
 
-    def setup_method(self) -> None:
-        """Set up test environment."""
-        reset_config()
-        AsyncioPySide6.reset_for_testing()
+    stub = SimpleNamespace(Process=make_process, virtual_memory=virtual_memory, calls=calls)
+    monkeypatch.setattr("AsyncioPySide6.nvd.performance.psutil", stub)
+    # Without /proc/self/statm the monitor takes RSS from psutil
+    monkeypatch.setattr("AsyncioPySide6.nvd.performance._STATM_PATH", "/nonexistent/statm")
+    return stub
 
-    def teardown_method(self) -> None:
-        """Clean up after each test."""
-        reset_config()
-        AsyncioPySide6.reset_for_testing()
+
+@pytest.mark.xdist_group("performance")
+class TestPerformanceMonitoring:
+    """Test performance monitoring functionality."""
 
     def test_performance_monitor_singleton(self) -> None:
         """Test that performance monitor follows singleton pattern."""
@@ -48,6 +75,15 @@ class TestPerformanceMonitoring:
         assert monitor1 is monitor2
         assert id(monitor1) == id(monitor2)
 
+    def test_performance_monitor_created_on_first_use(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the global monitor is built lazily and sees configuration set before then."""
+        monkeypatch.setattr("AsyncioPySide6.nvd.performance._MONITOR", None)
+        get_config().metrics_history_size = 7
+
+        monitor = get_performance_monitor()
+        assert monitor.metrics_history.maxlen == 7
+        assert get_performance_monitor() is monitor
+
     def test_start_stop_monitoring(self) -> None:
         """Test starting and stopping performance monitoring."""
         # Enable performance monitoring before getting the monitor
@@ -74,6 +110,18 @@ class TestPerformanceMonitoring:
         monitor = get_performance_monitor()
         assert task_id in monitor._task_metrics
 
+    def test_record_task_skipped_when_task_monitoring_disabled(self) -> None:
+        """Test that nothing is recorded while task monitoring is disabled."""
+        get_config().enable_task_monitoring = False
+        task_id = "untracked_task"
+
+        record_task_start(task_id)
+        record_task_completion(task_id, True)
+
+        monitor = get_performance_monitor()
+        assert task_id not in monitor._task_metrics
+        assert monitor._completed_count == 0
+
     def test_record_task_completion(self) -> None:
         """Test recording task completion."""
         task_id = "test_task_456"
@@ -115,8 +163,6 @@ class TestPerformanceMonitoring:
         set_config(config)
         monitor = get_performance_monitor()
         # Inject a real metric
-        from AsyncioPySide6.nvd.performance import PerformanceMetrics
-
         metric = PerformanceMetrics(
             timestamp=time.time(),
             active_tasks=1,
@@ -150,8 +196,6 @@ class TestPerformanceMonitoring:
         time.sleep(0.01)
         record_task_completion("test_task_health", True)
         # Inject a real metric
-        from AsyncioPySide6.nvd.performance import PerformanceMetrics
-
         metric = PerformanceMetrics(
             timestamp=time.time(),
             active_tasks=1,
@@ -168,6 +212,97 @@ class TestPerformanceMonitoring:
         assert "active_tasks" in health
         assert "completed_tasks" in health
 
+    def test_health_status_cached_until_new_sample(self) -> None:
+        """Test that health status is reused until a new sample is recorded."""
+        monitor = PerformanceMonitor()
+        monitor.config.health_cache_ttl = 60.0
+
+        def sample(memory_percentage: float) -> PerformanceMetrics:
+            return PerformanceMetrics(
+                timestamp=time.time(),
+                active_tasks=0,
+                memory_usage_mb=100.0,
+                memory_percentage=memory_percentage,
+                event_loop_latency_ms=0.0,
+                task_completion_rate=1.0,
+                error_rate=0.0,
+                cpu_usage_percentage=10.0,
+            )
+
+        monitor.metrics_history.append(sample(0.5))
+        first = monitor.get_health_status()
+        # Mutating a returned result must not leak into later cached reads
+        first["status"] = "mutated"
+        first["metrics"]["extra"] = 1
+        with patch.object(monitor, "_build_health_status") as build:
+            cached = monitor.get_health_status()
+            build.assert_not_called()
+        assert cached["status"] == "healthy"
+        assert "extra" not in cached["metrics"]
+
+        # New lag samples invalidate the cache even once the sample deque is full
+        size = monitor._lag_samples.maxlen
+        monitor._lag_samples.extend([0.001] * size)
+        monitor._lag_sample_count += size
+        assert monitor.get_health_status()["status"] == "healthy"
+        monitor._lag_samples.extend([0.5] * size)
+        monitor._lag_sample_count += size
+        assert monitor.get_health_status()["status"] == "degraded"
+
+        monitor.metrics_history.append(sample(95.0))
+        assert monitor.get_health_status()["status"] == "critical"
+
+    def test_health_status_degraded_by_loop_lag(self) -> None:
+        """Test that a high loop lag p95 marks health as degraded."""
+        monitor = PerformanceMonitor()
+        monitor.metrics_history.append(
+            PerformanceMetrics(
+                timestamp=time.time(),
+                active_tasks=0,
+                memory_usage_mb=100.0,
+                memory_percentage=0.5,
+                event_loop_latency_ms=0.0,
+                task_completion_rate=1.0,
+                error_rate=0.0,
+                cpu_usage_percentage=10.0,
+            )
+        )
+        monitor._lag_samples.extend([0.001] * 90 + [0.5] * 10)
+
+        health = monitor.get_health_status()
+        assert health["status"] == "degraded"
+        assert health["loop_lag_p95"] == pytest.approx(500.0)
+
+    def test_loop_lag_probe_samples_blocking(self) -> None:
+        """Test that the lag probe records time the loop spent blocked."""
+        config = get_config()
+        config.enable_performance_monitoring = True
+        config.loop_lag_interval = 0.01
+        set_config(config)
+        monitor = PerformanceMonitor()
+
+        async def run_test() -> None:
+            monitor.start_monitoring()
+            await asyncio.sleep(0)
+            time.sleep(0.05)  # Block the loop
+            await asyncio.sleep(0.02)
+            monitor.stop_monitoring()
+
+        asyncio.run(run_test())
+        assert max(monitor._lag_samples) >= 0.03
+
+    def test_latency_probe_waits_behind_queued_callbacks(self) -> None:
+        """Test that the call_soon probe reports time spent behind queued callbacks."""
+        monitor = PerformanceMonitor()
+
+        async def run_test() -> float:
+            asyncio.get_running_loop().call_soon(time.sleep, 0.05)  # Queued ahead of the probe
+            return await monitor._probe_latency()
+
+        latency = asyncio.run(run_test())
+        assert latency >= 0.05
+        assert monitor._collect_metrics(latency).event_loop_latency_ms == pytest.approx(latency * 1000)
+
     def test_circuit_breaker(self) -> None:
         """Test circuit breaker functionality."""
         monitor = get_performance_monitor()
@@ -209,6 +344,8 @@ class TestPerformanceMonitoring:
             cb.call(failing_func)
         assert cb.failure_count == 2
         assert cb.state == "OPEN"
+        # last_failure_time stays a wall-clock timestamp in seconds
+        assert cb.last_failure_time == pytest.approx(time.time(), abs=5.0)
 
     def test_circuit_breaker_recovery(self) -> None:
         """Test circuit breaker recovery."""
@@ -217,7 +354,7 @@ class TestPerformanceMonitoring:
 
         # Set low threshold and recovery time for testing
         cb.threshold = 1
-        cb.recovery_time = 0.1
+        cb.recovery_time = 0.01
 
         def failing_func() -> str:
             raise Exception("Test failure")
@@ -231,13 +368,41 @@ class TestPerformanceMonitoring:
         assert cb.state == "OPEN"
 
         # Wait for recovery time
-        time.sleep(0.2)
+        time.sleep(0.02)
 
         # Try successful call - should recover
         result = cb.call(successful_func)
         assert result == "success"
         assert cb.state == "CLOSED"
 
+    def test_circuit_breaker_half_open_failure_reopens(self) -> None:
+        """Test that a failure while half-open opens the circuit again."""
+        cb = CircuitBreaker(threshold=1, recovery_time=0.0)
+
+        def failing_func() -> str:
+            raise Exception("Test failure")
+
+        with pytest.raises(Exception):
+            cb.call(failing_func)
+        assert cb.state == "OPEN"
+
+        # Recovery time has elapsed, so the next call is let through half-open
+        with pytest.raises(Exception, match="Test failure"):
+            cb.call(failing_func)
+        assert cb.state == "OPEN"
+        assert cb.failure_count == 2
+
+    def test_circuit_breaker_rebuilds_call_on_reconfigure(self) -> None:
+        """Test that changing the threshold takes effect on the next call."""
+        cb = CircuitBreaker(threshold=5)
+        original_call = cb.call
+        cb.threshold = 1
+        assert cb.call is not original_call
+
+        with pytest.raises(Exception):
+            cb.call(lambda: 1 / 0)
+        assert cb.state == "OPEN"
+
     def test_metrics_collection(self) -> None:
         """Test metrics collection."""
         monitor = get_performance_monitor()
@@ -247,7 +412,7 @@ class TestPerformanceMonitoring:
 
         # Record some activity
         record_task_start("task1")
-        time.sleep(0.1)
+        time.sleep(0.001)
         record_task_completion("task1", True)
 
         # Get recent metrics
@@ -261,30 +426,46 @@ class TestPerformanceMonitoring:
             assert hasattr(metric, "active_tasks")
             assert hasattr(metric, "memory_usage_mb")
 
-    def test_memory_monitoring(self) -> None:
+    def test_memory_monitoring(self, psutil_stub: SimpleNamespace) -> None:
         """Test memory monitoring functionality."""
-        monitor = get_performance_monitor()
-
-        # Mock psutil for consistent testing
-        with patch("AsyncioPySide6.nvd.performance.psutil") as mock_psutil:
-            # Mock process
-            mock_process = Mock()
-            mock_memory_info = Mock()
-            mock_memory_info.rss = 1024 * 1024 * 100  # 100MB
-            mock_process.memory_info.return_value = mock_memory_info
-            mock_process.cpu_percent.return_value = 25.0
-            mock_psutil.Process.return_value = mock_process
-
-            # Mock virtual memory
-            mock_virtual_memory = Mock()
-            mock_virtual_memory.total = 1024 * 1024 * 1024 * 8  # 8GB
-            mock_psutil.virtual_memory.return_value = mock_virtual_memory
-
-            # Test memory collection
+        # The monitor reads the process handle and total RAM once, on construction
+        monitor = PerformanceMonitor()
+        for _ in range(2):
             metrics = monitor._collect_metrics()
 
-            assert metrics.memory_usage_mb > 0
-            assert metrics.memory_percentage > 0
+        assert metrics.memory_usage_mb == 100
+        assert metrics.memory_percentage == 100 / (8 * 1024)
+        assert metrics.cpu_usage_percentage == 25.0
+        assert psutil_stub.calls == {"Process": 1, "virtual_memory": 1}
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc/self/statm is Linux-only")
+    def test_rss_read_from_statm(self) -> None:
+        """Test that RSS read from /proc/self/statm agrees with psutil."""
+        monitor = PerformanceMonitor()
+        assert monitor._statm_fd is not None
+
+        rss = monitor._rss()
+        assert rss == pytest.approx(monitor._process.memory_info().rss, rel=0.1)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_rss_rebinds_after_fork(self) -> None:
+        """Test that a forked child reports its own RSS rather than the parent's."""
+        monitor = PerformanceMonitor()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # Child: grow well past the parent's RSS, then report both readings
+            try:
+                ballast = b"x" * (64 * 1024 * 1024)
+                actual = psutil.Process().memory_info().rss
+                os.write(write_fd, f"{monitor._rss()} {actual} {len(ballast)}".encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        reported, actual, _ = map(int, os.read(read_fd, 128).split())
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        assert reported == pytest.approx(actual, rel=0.1)
+        assert monitor._pid == os.getpid()
 
     def test_performance_configuration(self) -> None:
         """Test performance monitoring configuration."""
@@ -304,11 +485,34 @@ class TestPerformanceMonitoring:
         assert new_config.enable_memory_monitoring == True
         assert new_config.enable_task_monitoring == True
 
+    def test_metrics_history_bounded_by_config(self) -> None:
+        """Test that the metrics history keeps only the configured number of samples."""
+        config = get_config()
+        config.metrics_history_size = 3
+        set_config(config)
+        monitor = PerformanceMonitor()
+
+        for i in range(5):
+            monitor.metrics_history.append(
+                PerformanceMetrics(
+                    timestamp=time.time() + i,
+                    active_tasks=i,
+                    memory_usage_mb=100.0,
+                    memory_percentage=0.5,
+                    event_loop_latency_ms=1.0,
+                    task_completion_rate=1.0,
+                    error_rate=0.0,
+                    cpu_usage_percentage=10.0,
+                )
+            )
+
+        assert [m.active_tasks for m in monitor.metrics_history] == [2, 3, 4]
+        monitor.cleanup_old_metrics()
+        assert monitor.metrics_history.maxlen == 3
+
     def test_metrics_cleanup(self) -> None:
         """Test metrics cleanup functionality."""
         monitor = get_performance_monitor()
-        from AsyncioPySide6.nvd.performance import PerformanceMetrics
-
         # Add some old metrics
         old_timestamp = time.time() - 3600  # 1 hour ago
         monitor._metrics.append(
@@ -341,10 +545,112 @@ class TestPerformanceMonitoring:
         # Should have fewer metrics after cleanup
         assert len(monitor._metrics) < initial_count
 
+    def test_task_metrics_recycled_after_cleanup(self) -> None:
+        """Test that cleaned-up task metrics are reused by new tasks."""
+        monitor = PerformanceMonitor()
+        two_hours_ago = time.monotonic() - 7200
+        with patch("AsyncioPySide6.nvd.performance.time.monotonic", return_value=two_hours_ago):
+            monitor.record_task_start("old_task")
+            monitor.record_task_completion("old_task", False, "boom")
+        monitor.record_task_start("recent_task")
+        monitor.record_task_completion("recent_task", True)
+        old_metric = monitor.task_metrics["old_task"]
+
+        monitor.cleanup_old_metrics()
+        assert "old_task" not in monitor.task_metrics
+        assert "recent_task" in monitor.task_metrics
+        assert len(monitor._expiry_heap) == 1
+        assert old_metric in monitor._metrics_pool
+
+        monitor.record_task_start("new_task")
+        new_metric = monitor.task_metrics["new_task"]
+        assert new_metric is old_metric
+        assert new_metric.task_id == "new_task"
+        assert new_metric.end_time is None
+        assert new_metric.success is None
+        assert new_metric.error is None
+
+    def test_task_records_bounded(self) -> None:
+        """Test that the oldest completed records are evicted past the record limit."""
+        monitor = PerformanceMonitor()
+        with patch("AsyncioPySide6.nvd.performance._TASK_RECORD_LIMIT", 3):
+            monitor.record_task("done_1", 1.0, 2.0, True)
+            monitor.record_task("done_2", 1.0, 3.0, True)
+            monitor.record_task_start("running")
+            monitor.record_task_start("newest")
+            monitor.flush()
+
+        assert set(monitor.task_metrics) == {"done_2", "running", "newest"}
+        assert monitor._completed_count == 1
+
+    def test_completed_task_count_tracking(self) -> None:
+        """Test that the completed-task counter follows recorded outcomes."""
+        monitor = PerformanceMonitor()
+        for task_id in ("a", "b", "c"):
+            monitor.record_task_start(task_id)
+        monitor.record_task_completion("a", True)
+        monitor.record_task_completion("b", True)
+        monitor.record_task_completion("c", False, "boom")
+        monitor.flush()
+        assert monitor._completed_count == 2
+
+        # Restarting a finished task id drops its previous outcome
+        monitor.record_task_start("a")
+        monitor.flush()
+        assert monitor._completed_count == 1
+        assert monitor._completed_count == sum(1 for m in monitor.task_metrics.values() if m.success is True)
+
+    def test_task_metrics_can_be_replaced(self) -> None:
+        """Test that assigning task_metrics replaces the records and their bookkeeping."""
+        monitor = PerformanceMonitor()
+        monitor.record_task_start("old_task")
+        monitor.record_task_completion("old_task", True)
+
+        monitor.task_metrics = {}
+        assert monitor.task_metrics == {}
+        assert monitor._completed_count == 0
+
+        done = TaskMetrics(task_id="kept", start_time=1.0, end_time=2.0, execution_time=1.0, success=True)
+        monitor._task_metrics = {"kept": done}
+        assert monitor.task_metrics == {"kept": done}
+        assert monitor._completed_count == 1
+        assert [task_id for _, _, task_id in monitor._expiry_heap] == ["kept"]
+
+    def test_task_events_applied_on_read(self) -> None:
+        """Test that recorded task events are queued until metrics are read."""
+        monitor = PerformanceMonitor()
+        monitor.record_task_start("queued_task")
+        monitor.record_task_completion("queued_task", True)
+        assert len(monitor._events) == 2
+
+        metric = monitor.task_metrics["queued_task"]
+        assert not monitor._events
+        assert metric.success is True
+        assert metric.execution_time is not None
+
+    def test_record_task_fused(self) -> None:
+        """Test recording a finished task with a single call."""
+        monitor = PerformanceMonitor()
+        monitor.record_task("fused_task", 10.0, 10.5, False, "No event loop")
+
+        metric = monitor.task_metrics["fused_task"]
+        assert metric.success is False
+        assert metric.error == "No event loop"
+        assert metric.execution_time == pytest.approx(0.5)
+
+    def test_mixed_task_id_types_expire_together(self) -> None:
+        """Test that int and str task ids finishing at the same time both expire."""
+        monitor = PerformanceMonitor()
+        monitor.record_task("named_task", 1.0, 5.0, True)
+        monitor.record_task(42, 2.0, 5.0, True)
+        monitor.flush()
+
+        with patch("AsyncioPySide6.nvd.performance.time.monotonic", return_value=5.0 + 3601):
+            monitor.cleanup_old_metrics()
+        assert monitor.task_metrics == {}
+
     def test_task_metrics_structure(self) -> None:
         """Test task metrics data structure."""
-        from AsyncioPySide6.nvd.performance import TaskMetrics
-
         # Create task metrics
         task_id = "test_task"
         start_time = time.time()
@@ -356,13 +662,12 @@ class TestPerformanceMonitoring:
         assert metrics.start_time == start_time
         assert metrics.end_time is None
         assert metrics.execution_time is None
+        assert not hasattr(metrics, "__dict__")
         assert metrics.success is None
         assert metrics.error is None
 
     def test_performance_metrics_structure(self) -> None:
         """Test performance metrics data structure."""
-        from AsyncioPySide6.nvd.performance import PerformanceMetrics
-
         # Create performance metrics
         timestamp = time.time()
         metrics = PerformanceMetrics(
@@ -393,19 +698,10 @@ class TestPerformanceMonitoring:
         assert metrics_dict["active_tasks"] == 5
 
 
+@pytest.mark.xdist_group("performance_integration")
 class TestPerformanceIntegration:
     """Test performance monitoring integration with AsyncioPySide6."""
 
-    def setup_method(self) -> None:
-        """Set up test environment."""
-        reset_config()
-        AsyncioPySide6.reset_for_testing()
-
-    def teardown_method(self) -> None:
-        """Clean up after each test."""
-        reset_config()
-        AsyncioPySide6.reset_for_testing()
-
     def test_performance_monitoring_with_tasks(self) -> None:
         """Test performance monitoring with actual tasks."""
         config = get_config()
@@ -415,23 +711,10 @@ class TestPerformanceIntegration:
             # Start performance monitoring
             start_performance_monitoring()
 
-            # Run some tasks
-            async def test_task() -> str:
-                await asyncio.sleep(0.1)
-                return "Task completed"
-
-            # Suppress the RuntimeWarning about unawaited coroutines
-            import warnings
-
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
-                AsyncioPySide6.runTask(test_task())
+            # Without a running loop the task is recorded as failed, not scheduled
+            assert AsyncioPySide6.runTask(_noop_task()) is None
 
-            # Wait for task to complete
-            time.sleep(0.2)
             # Inject a real metric
-            from AsyncioPySide6.nvd.performance import PerformanceMetrics
-
             monitor = get_performance_monitor()
             metric = PerformanceMetrics(
                 timestamp=time.time(),
@@ -452,8 +735,6 @@ class TestPerformanceIntegration:
         """Test health status integration."""
         with AsyncioPySide6() as manager:
             # Inject a real metric
-            from AsyncioPySide6.nvd.performance import PerformanceMetrics
-
             monitor = get_performance_monitor()
             metric = PerformanceMetrics(
                 timestamp=time.time(),
@@ -1,11 +1,8 @@
 # setup.py
 from setuptools import setup, find_packages
 
-# read the contents of your README file
-from pathlib import Path
-this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text()
-
+# The long description comes from `readme` in pyproject.toml, so the README
+# is only read when metadata is built rather than on every setup.py run.
 setup(
     name='pyside6-asyncplus',
     version='0.1.0',
@@ -15,6 +12,4 @@ setup(
     ],
     entry_points={},
     test_suite='tests',
-    long_description=long_description,
-    long_description_content_type='text/markdown'
 )